@@ -15,65 +15,80 @@ The script will:
 3. Start the server on the port specified by CDSW_APP_PORT (or default to 8080)
 """
 
+import logging
 import os
 import sys
-import logging
 from pathlib import Path
 
 # Setup logging
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 70
+
+# Environment variables that override GuardrailsConfig fields:
+# (env var, config attribute, redact value in logs)
+_ENV_OVERRIDES = (
+    ("LLM_MODEL", "llm_model", False),
+    ("LLM_API_KEY", "llm_api_key", True),
+    ("LLM_API_BASE", "llm_api_base", False),
+)
+
 
 def main():
     """Main entry point for CAI Application deployment."""
 
-    logger.info("=" * 70)
-    logger.info("Starting NeMo Guardrails Server for Cloudera AI")
-    logger.info("=" * 70)
+    # One log record per banner instead of three separate handler dispatches
+    logger.info("\n%s\nStarting NeMo Guardrails Server for Cloudera AI\n%s", _BANNER, _BANNER)
+
+    # Snapshot the environment once - os.environ lookups go through a UserDict
+    # proxy, so repeated probes are noticeably slower than a plain dict
+    env = dict(os.environ)
 
     # Check if running in CAI environment
-    if "CDSW_APP_PORT" in os.environ:
-        logger.info(f"Detected CAI environment - CDSW_APP_PORT: {os.environ['CDSW_APP_PORT']}")
+    cdsw_app_port = env.get("CDSW_APP_PORT")
+    if cdsw_app_port is not None:
+        logger.info(f"Detected CAI environment - CDSW_APP_PORT: {cdsw_app_port}")
     else:
         logger.warning("CDSW_APP_PORT not found - may not be running in CAI Application mode")
 
     # Get configuration path from environment or use default
-    config_path = os.environ.get("GUARDRAILS_CONFIG_PATH", "config")
-    config_file = os.environ.get("GUARDRAILS_CONFIG_FILE")
+    config_path = env.get("GUARDRAILS_CONFIG_PATH", "config")
+    config_file = env.get("GUARDRAILS_CONFIG_FILE")
 
     logger.info(f"Guardrails config path: {config_path}")
 
     try:
-        from nemo_guardrails_cai import GuardrailsServer, GuardrailsConfig
-
-        # Load configuration
-        if config_file and Path(config_file).exists():
-            logger.info(f"Loading configuration from file: {config_file}")
-            config = GuardrailsConfig.from_yaml(config_file)
-        else:
+        from nemo_guardrails_cai import GuardrailsConfig, GuardrailsServer
+
+        # Load configuration. Let from_yaml do the open directly instead of a
+        # separate exists() probe - one stat per load instead of two, which
+        # matters on the NFS-backed /home/cdsw filesystem
+        config = None
+        if config_file:
+            try:
+                config = GuardrailsConfig.from_yaml(config_file)
+                logger.info(f"Loaded configuration from file: {config_file}")
+            except FileNotFoundError:
+                logger.warning(f"Config file not found: {config_file}, using defaults")
+
+        if config is None:
             logger.info("Using default configuration")
             config = GuardrailsConfig(
                 config_path=Path(config_path),
                 host="0.0.0.0",
-                log_level=os.environ.get("LOG_LEVEL", "INFO")
+                log_level=env.get("LOG_LEVEL", "INFO"),
             )
 
         # Override with environment variables if present
-        if "LLM_MODEL" in os.environ:
-            config.llm_model = os.environ["LLM_MODEL"]
-            logger.info(f"Using LLM model from environment: {config.llm_model}")
-
-        if "LLM_API_KEY" in os.environ:
-            config.llm_api_key = os.environ["LLM_API_KEY"]
-            logger.info("LLM API key loaded from environment")
-
-        if "LLM_API_BASE" in os.environ:
-            config.llm_api_base = os.environ["LLM_API_BASE"]
-            logger.info(f"Using LLM API base: {config.llm_api_base}")
+        for var, attr, sensitive in _ENV_OVERRIDES:
+            value = env.get(var)
+            if value is None:
+                continue
+            setattr(config, attr, value)
+            logger.info(f"Using {attr} from environment: {'<redacted>' if sensitive else value}")
 
         # Create and start server
         logger.info("Initializing Guardrails Server...")
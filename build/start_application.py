@@ -10,15 +10,17 @@ This script:
 This approach matches the pattern used in CAI_AMP projects.
 """
 
-import subprocess
+import logging
 import os
 import sys
-import logging
-from pathlib import Path
+
+# Make cai_integration importable regardless of where the script is run from
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cai_integration._env import IS_CAI, project_root
 
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
@@ -26,46 +28,22 @@ logger = logging.getLogger(__name__)
 def main():
     """Main entry point for starting the application."""
 
-    # Check if we're in a CAI (IS_COMPOSABLE) environment
-    is_composable = os.getenv("IS_COMPOSABLE")
-
-    if is_composable:
-        # If running in CAI, change to the specified project root
-        project_root = Path("/home/cdsw/nemo-guardrails-cai")
-        logger.info(f"Running in CAI environment")
-        logger.info(f"Project root: {project_root}")
-    else:
-        # Otherwise, use the current directory as the project root
-        project_root = Path.cwd()
-        logger.info(f"Running locally")
-        logger.info(f"Project root: {project_root}")
-
-    # Add project root to Python path
-    sys.path.insert(0, str(project_root))
+    root = project_root()
+    logger.info("Running in CAI environment" if IS_CAI else "Running locally")
+    logger.info(f"Project root: {root}")
 
     # Change to project root directory
-    os.chdir(project_root)
+    os.chdir(root)
     logger.info(f"Changed to directory: {os.getcwd()}")
 
     # Execute the start application shell script
-    logger.info("=" * 60)
-    logger.info("Starting NeMo Guardrails Application")
-    logger.info("=" * 60)
+    banner = "=" * 60
+    logger.info("\n%s\nStarting NeMo Guardrails Application\n%s", banner, banner)
 
     try:
-        # Run the bash script
-        result = subprocess.run(
-            ["bash", "build/shell_scripts/start_application.sh"],
-            check=True,
-            cwd=project_root
-        )
-
-        logger.info("Application completed successfully")
-        return result.returncode
-
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Application failed with exit code {e.returncode}")
-        return e.returncode
+        # Replace this process with the bash script - no post-processing is
+        # needed here, so avoid keeping a parent Python process around
+        os.execvp("bash", ["bash", "build/shell_scripts/start_application.sh"])
     except Exception as e:
         logger.error(f"Error starting application: {e}", exc_info=True)
         return 1
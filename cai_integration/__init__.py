@@ -0,0 +1 @@
+"""CAI (Cloudera AI) integration scripts and shared helpers."""
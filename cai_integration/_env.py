@@ -0,0 +1,24 @@
+"""Shared CAI environment detection for deployment and build scripts."""
+
+import functools
+import os
+from pathlib import Path
+
+# True when running inside a CAI (IS_COMPOSABLE) environment. Computed once at
+# import so callers test a plain bool instead of probing os.environ repeatedly.
+IS_CAI = bool(os.getenv("IS_COMPOSABLE"))
+
+
+@functools.cache
+def project_root() -> Path:
+    """Return the project root directory.
+
+    In CAI the project is checked out under a fixed path; locally the current
+    working directory is used. Cached so the getcwd syscall runs at most once.
+
+    Returns:
+        Path to the project root
+    """
+    if IS_CAI:
+        return Path("/home/cdsw/nemo-guardrails-cai")
+    return Path.cwd()
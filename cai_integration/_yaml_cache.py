@@ -0,0 +1,110 @@
+"""Shared cached YAML loader for the CAI integration scripts and package.
+
+Parsing goes through libyaml's CSafeLoader when PyYAML was built against
+libyaml (roughly an order of magnitude faster than the pure-Python loader),
+falling back transparently otherwise. Install PyYAML with libyaml headers
+present to get the fast path.
+
+Two cache layers keep repeated loads cheap:
+- an in-process LRU keyed by (path, mtime_ns, size), so unchanged files
+  skip parsing entirely within one process;
+- a JSON sidecar (`<path>.cache.json`) written after the first parse, so
+  subsequent process starts skip the YAML parse as long as the file is
+  unchanged. Sidecar reads and writes are best-effort; the YAML remains
+  the source of truth.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# LRU cache of parsed YAML files keyed by (resolved path, mtime_ns, size) so
+# edits to a file naturally miss. Capped so long-lived processes that touch
+# many configs cannot grow it unboundedly.
+_MAX_ENTRIES = 32
+_cache: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _load_json_sidecar(abs_path: str, yaml_stat: os.stat_result, raw: bytes) -> Optional[dict]:
+    """Load the JSON sidecar cache for a YAML file, if it is still valid.
+
+    The sidecar stores an md5 of the YAML source so stale or corrupt caches
+    are detected and ignored.
+
+    Args:
+        abs_path: Absolute path to the YAML file
+        yaml_stat: Stat result of the YAML file
+        raw: Raw bytes of the YAML file
+
+    Returns:
+        Cached configuration dictionary, or None if the sidecar is missing or stale
+    """
+    sidecar = abs_path + ".cache.json"
+    try:
+        if os.stat(sidecar).st_mtime < yaml_stat.st_mtime:
+            return None
+        with open(sidecar) as f:
+            payload = json.load(f)
+        if payload.get("source_md5") != hashlib.md5(raw).hexdigest():
+            return None
+        return payload.get("config")
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_sidecar(abs_path: str, raw: bytes, config: dict) -> None:
+    """Write the JSON sidecar cache for a parsed YAML file (best-effort)."""
+    sidecar = abs_path + ".cache.json"
+    try:
+        with open(sidecar, "w") as f:
+            json.dump({"source_md5": hashlib.md5(raw).hexdigest(), "config": config}, f)
+    except (OSError, TypeError):
+        # Cache writes are best-effort; the YAML remains the source of truth
+        pass
+
+
+def load_yaml_cached(path: str) -> Dict[str, Any]:
+    """Parse a YAML file, reusing the cached result while the file is unchanged.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed configuration dictionary (a copy safe for callers to mutate)
+    """
+    resolved = str(Path(path).resolve())
+    st = os.stat(resolved)
+    key = (resolved, st.st_mtime_ns, st.st_size)
+
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return copy.deepcopy(_cache[key])
+
+    with open(resolved, "rb") as f:
+        raw = f.read()
+
+    config = _load_json_sidecar(resolved, st, raw)
+    if config is None:
+        # Imported lazily so importing this module stays cheap when the
+        # sidecar cache already covers the config
+        import yaml
+
+        # Prefer the libyaml C loader; fall back to pure Python when
+        # unavailable. Parsing the single raw buffer avoids stream chunking.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        config = yaml.load(raw, Loader=loader)
+        _write_json_sidecar(resolved, raw, config)
+
+    with _cache_lock:
+        _cache[key] = config
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+    return copy.deepcopy(config)
@@ -11,9 +11,8 @@ This is the startup script for the CAI Application. It:
 This script is set as the entry point when creating the CAI Application.
 """
 
-import subprocess
-import sys
 import os
+import sys
 from pathlib import Path
 
 
@@ -35,18 +34,17 @@ def main():
     print(f"📝 Executing: {bash_startup.name}\n")
 
     try:
-        # Execute bash startup script
-        result = subprocess.run(
-            ["bash", str(bash_startup)],
-            cwd=str(project_root),
-            env={**os.environ, "PROJECT_ROOT": str(project_root)}
-        )
-
-        return result.returncode
+        # Replace this process with the bash startup script - the server it
+        # launches becomes the top-level process, avoiding a second Python
+        # process hanging around just to forward the exit code
+        os.chdir(project_root)
+        env = {**os.environ, "PROJECT_ROOT": str(project_root)}
+        os.execvpe("bash", ["bash", str(bash_startup)], env)
 
     except Exception as e:
         print(f"\n❌ Error executing startup script: {e}")
         import traceback
+
         traceback.print_exc()
         return 1
 
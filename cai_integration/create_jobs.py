@@ -10,13 +10,26 @@ This script:
 """
 
 import argparse
+import atexit
 import json
 import os
 import sys
-import yaml
-import requests
+from collections import deque
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from cai_integration._yaml_cache import load_yaml_cached
+except ImportError:  # run directly as a script rather than as a package module
+    from _yaml_cache import load_yaml_cached
+
+
+# Topological order persisted next to job_ids.json, keyed by the config's
+# resolved path and mtime so edits to (or swaps of) the config invalidate it
+DAG_PATH = "/tmp/dag.json"
 
 
 class JobManager:
@@ -38,6 +51,13 @@ class JobManager:
             "Accept": "application/json",
             "Authorization": f"Bearer {self.api_key.strip()}",
         }
+        # Persistent session: one job pipeline issues a dozen or more API
+        # calls, so reusing a pooled TLS connection avoids a handshake each
+        # time (requests.request builds and tears down a Session per call)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+        atexit.register(self.session.close)
 
     def make_request(
         self, method: str, endpoint: str, data: dict = None, params: dict = None
@@ -46,10 +66,9 @@ class JobManager:
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
 
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
-                headers=self.headers,
                 json=data,
                 params=params,
                 timeout=30,
@@ -78,8 +97,7 @@ class JobManager:
             config_path = Path(config_path)
 
         try:
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_cached(str(config_path))
             print(f"✅ Loaded jobs config from {config_path}")
             return config
         except Exception as e:
@@ -140,6 +158,38 @@ class JobManager:
             print(f"   ❌ Failed to create job: {job_name}")
             return None
 
+    def _load_cached_dag(self, config_path: str, yaml_mtime_ns: Optional[int]) -> Optional[list]:
+        """Return the cached topological order if still fresh, else None.
+
+        The cache only applies to the exact config it was computed from:
+        two configs can share an mtime (e.g. one git clone), so the
+        resolved path is checked alongside it.
+        """
+        if yaml_mtime_ns is None:
+            return None
+        try:
+            with open(DAG_PATH, "rb") as f:
+                dag = json.load(f)
+            if dag.get("config_path") != config_path or dag.get("yaml_mtime_ns") != yaml_mtime_ns:
+                return None
+            return dag["order"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save_dag(self, config_path: str, yaml_mtime_ns: Optional[int], order: list) -> None:
+        """Persist the topological order, atomically."""
+        if yaml_mtime_ns is None:
+            return
+        try:
+            tmp_path = DAG_PATH + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {"config_path": config_path, "yaml_mtime_ns": yaml_mtime_ns, "order": order}, f
+                )
+            os.replace(tmp_path, DAG_PATH)
+        except OSError:
+            pass  # Cache is best-effort; next run just recomputes
+
     def create_jobs_from_config(self, project_id: str, config_path: str = None) -> Dict[str, str]:
         """Create all jobs from configuration."""
         print("\n" + "=" * 70)
@@ -158,24 +208,60 @@ class JobManager:
         # Track created/existing job IDs
         job_ids = {}
 
-        # Process jobs in dependency order
+        # The topological order depends only on jobs_config.yaml, which
+        # changes rarely; reuse the persisted order while the config path
+        # and mtime match and only recompute (and re-persist) after an edit
         jobs_config = config["jobs"]
-        processed = set()
-
-        def create_job_with_deps(job_key: str):
-            """Recursively create job and its dependencies."""
-            if job_key in processed:
-                return
-
+        resolved_config = str(
+            (
+                Path(config_path) if config_path else Path(__file__).parent / "jobs_config.yaml"
+            ).resolve()
+        )
+        try:
+            yaml_mtime_ns = os.stat(resolved_config).st_mtime_ns
+        except OSError:
+            yaml_mtime_ns = None
+
+        order = self._load_cached_dag(resolved_config, yaml_mtime_ns)
+        if order is not None and not set(order) <= set(jobs_config):
+            # A stale order naming jobs absent from the current config
+            # would KeyError below; recompute instead of trusting it
+            order = None
+        if order is None:
+            # Process jobs in topological order (iterative Kahn's algorithm):
+            # one pass builds the adjacency info, then parents are created
+            # before children without recursion, which also handles
+            # DAG-shaped configs and deep chains without the recursion limit
+            indeg = {}
+            children = {}
+            for job_key, job_config in jobs_config.items():
+                parent_key = job_config.get("parent_job_key")
+                if parent_key is not None and parent_key in jobs_config:
+                    indeg[job_key] = 1
+                    children.setdefault(parent_key, []).append(job_key)
+                else:
+                    indeg[job_key] = 0
+
+            queue = deque(job_key for job_key, degree in indeg.items() if degree == 0)
+            order = []
+            while queue:
+                job_key = queue.popleft()
+                order.append(job_key)
+                for child in children.get(job_key, ()):
+                    indeg[child] -= 1
+                    if indeg[child] == 0:
+                        queue.append(child)
+
+            self._save_dag(resolved_config, yaml_mtime_ns, order)
+
+        if len(order) != len(jobs_config):
+            skipped = sorted(set(jobs_config) - set(order))
+            print(f"   ⚠️  Skipping jobs with cyclic dependencies: {', '.join(skipped)}")
+
+        # Create all jobs, parents first
+        for job_key in order:
             job_config = jobs_config[job_key]
-
-            # First create parent job if specified
-            parent_job_key = job_config.get("parent_job_key")
-            parent_job_id = None
-
-            if parent_job_key:
-                create_job_with_deps(parent_job_key)
-                parent_job_id = job_ids.get(parent_job_key)
+            parent_job_id = job_ids.get(job_config.get("parent_job_key"))
 
             # Check if job already exists
             job_name = job_config["name"]
@@ -190,13 +276,20 @@ class JobManager:
                     job_ids[job_key] = job_id
                 # If creation fails, error message already printed by create_job
 
-            processed.add(job_key)
+        print(f"\n✅ Created/verified {len(job_ids)} jobs")
 
-        # Create all jobs
-        for job_key in jobs_config.keys():
-            create_job_with_deps(job_key)
+        # Persist the name -> id mapping so trigger_jobs.py can resolve jobs
+        # without an extra API listing; written atomically via os.replace
+        name_to_id = {jobs_config[key]["name"]: job_id for key, job_id in job_ids.items()}
+        try:
+            tmp_path = "/tmp/job_ids.json.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(name_to_id, f)
+            os.replace(tmp_path, "/tmp/job_ids.json")
+            print("   💾 Saved job IDs to /tmp/job_ids.json")
+        except OSError as e:
+            print(f"   ⚠️  Could not save job IDs: {e}")
 
-        print(f"\n✅ Created/verified {len(job_ids)} jobs")
         return job_ids
 
     def run(self, project_id: str, config_path: str = None) -> bool:
@@ -216,7 +309,7 @@ class JobManager:
         print("=" * 70)
         print(f"\n✅ Created/verified {len(job_ids)} jobs")
 
-        print(f"\n💡 To trigger jobs, run:")
+        print("\n💡 To trigger jobs, run:")
         print(f"   python3 cai_integration/trigger_jobs.py --project-id {project_id}")
 
         return True
@@ -11,24 +11,84 @@ This script:
 Uses direct CAI REST API calls instead of external dependencies.
 """
 
-import os
-import sys
+import argparse
 import json
 import logging
+import os
+import random
+import sys
+import threading
 import time
-import requests
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Dict, Optional, Tuple
 
-import yaml
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+try:
+    from cai_integration._yaml_cache import load_yaml_cached
+except ImportError:
+    from _yaml_cache import load_yaml_cached
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 60
+
+# Startup script for the CAI Application. Constant, so built once at import
+# time rather than re-assembled on every create_application call
+_STARTUP_SCRIPT = """#!/bin/bash
+set -eox pipefail
+
+# CAI Application Startup Wrapper
+# This simple script calls the Python entry point which handles all setup
+
+cd /home/cdsw
+
+# Execute the Python startup script
+exec python cai_integration/app_startup.py
+"""
+
 
 class GuardrailsDeployer:
     """Manages NeMo Guardrails deployment on CAI using REST API."""
 
+    # Sessions shared across deployer instances, keyed by (host, api key) so
+    # multi-environment deploys reuse one TLS connection pool per target
+    _sessions: Dict[Tuple[str, str], Any] = {}
+    _sessions_lock = threading.Lock()
+
+    @classmethod
+    def _get_session(cls, cml_host: str, api_key: str, headers: Dict[str, str]):
+        """Return the shared requests.Session for a CML host, creating it once."""
+        key = (cml_host, api_key)
+        with cls._sessions_lock:
+            session = cls._sessions.get(key)
+            if session is None:
+                # Imported lazily so importing this module costs nothing until
+                # a deployer is actually constructed
+                import requests
+                from requests.adapters import HTTPAdapter, Retry
+
+                # Persistent session so the polling loop reuses one TLS
+                # connection instead of doing a fresh handshake per request;
+                # transient 5xx errors are retried by the adapter
+                session = requests.Session()
+                session.headers.update(headers)
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=4,
+                    max_retries=Retry(
+                        total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+                    ),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls._sessions[key] = session
+            return session
+
     def __init__(
         self,
         cml_host: str,
@@ -49,12 +109,18 @@ class GuardrailsDeployer:
         self.project_id = project_id
         self.config_path = config_path
         self.api_url = f"{cml_host.rstrip('/')}/api/v2"
+        # Precomputed prefix so the hot make_request path only concatenates
+        self._api_url_slash = self.api_url + "/"
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
             "Authorization": f"Bearer {api_key.strip()}",
         }
+        self.session = self._get_session(self.cml_host, api_key, self.headers)
         self.config = self._load_config()
+        # self.config is immutable after load, so the application payload can
+        # be composed once here; retried create_application calls reuse it
+        self._app_config = self._compose_app_config()
 
     def make_request(
         self, method: str, endpoint: str, data: dict = None, params: dict = None
@@ -70,31 +136,37 @@ class GuardrailsDeployer:
         Returns:
             Response JSON as dictionary, or None on error
         """
-        url = f"{self.api_url}/{endpoint.lstrip('/')}"
+        url = self._api_url_slash + endpoint.lstrip("/")
 
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
-                headers=self.headers,
                 json=data,
                 params=params,
                 timeout=30,
             )
 
             if 200 <= response.status_code < 300:
-                if response.text:
+                if response.content:
                     try:
+                        # orjson decodes the raw bytes directly, skipping the
+                        # text-decoding round-trip of response.json()
+                        if orjson is not None:
+                            return orjson.loads(response.content)
                         return response.json()
-                    except json.JSONDecodeError:
+                    except ValueError:
                         return {}
                 return {}
             else:
-                logger.error(f"API Error ({response.status_code}): {response.text[:200]}")
+                if logger.isEnabledFor(logging.ERROR):
+                    # content[:200] skips the charset detection that .text
+                    # performs on large error payloads
+                    logger.error("API Error (%d): %s", response.status_code, response.content[:200])
                 return None
 
         except Exception as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             return None
 
     def _load_config(self) -> dict:
@@ -105,8 +177,7 @@ class GuardrailsDeployer:
             logger.warning(f"Config file not found: {config_file}, using defaults")
             return self._default_config()
 
-        with open(config_file, "r") as f:
-            config = yaml.safe_load(f)
+        config = load_yaml_cached(str(config_file))
 
         logger.info(f"Loaded configuration from {config_file}")
         return config
@@ -121,30 +192,21 @@ class GuardrailsDeployer:
             "guardrails": {"config_path": "config"},
         }
 
-    def create_application(self) -> Optional[Dict[str, Any]]:
-        """Create CAI Application for guardrails server.
+    def _compose_app_config(self) -> Dict[str, Any]:
+        """Compose the application creation payload from the loaded config.
 
         Returns:
-            Application object with id, name, subdomain, etc.
+            Application payload ready to POST to the applications endpoint
         """
         server_config = self.config.get("server", {})
         guardrails_config = self.config.get("guardrails", {})
 
-        app_name = "nemo-guardrails-server"
-        # Subdomain must match pattern: ^[a-z0-9]+(-[a-z0-9]+)*$
-        app_subdomain = "nemo-guardrails"
-
-        logger.info(f"Creating application: {app_name} (subdomain: {app_subdomain})")
-
-        # Build startup script
-        startup_script = self._build_startup_script()
-
-        # Build application configuration
-        app_data = {
-            "name": app_name,
-            "subdomain": app_subdomain,
+        return {
+            "name": "nemo-guardrails-server",
+            # Subdomain must match pattern: ^[a-z0-9]+(-[a-z0-9]+)*$
+            "subdomain": "nemo-guardrails",
             "description": "NeMo Guardrails Server",
-            "script": startup_script,
+            "script": self._build_startup_script(),
             "cpu": server_config.get("cpu", 4),
             "memory": server_config.get("memory", 16),
             "environment": {
@@ -157,6 +219,20 @@ class GuardrailsDeployer:
             ),
         }
 
+    def create_application(self) -> Optional[Dict[str, Any]]:
+        """Create CAI Application for guardrails server.
+
+        Returns:
+            Application object with id, name, subdomain, etc.
+        """
+        # Payload was composed once in __init__; this method only performs
+        # the POST, so retries skip the dict/string rebuilding
+        app_data = self._app_config
+
+        logger.info(
+            f"Creating application: {app_data['name']} (subdomain: {app_data['subdomain']})"
+        )
+
         try:
             # Create application via REST API
             result = self.make_request(
@@ -175,27 +251,19 @@ class GuardrailsDeployer:
             return None
 
     def _build_startup_script(self) -> str:
-        """Build the startup script for the application.
+        """Return the startup script for the application.
 
-        Returns a simple bash wrapper that calls the Python entry point script.
-        The Python script (app_startup.py) handles environment setup and launches
-        the NeMo Guardrails server via the bash script (app_startup.sh).
+        The script is a simple bash wrapper that calls the Python entry point
+        (app_startup.py), which handles environment setup and launches the
+        NeMo Guardrails server via app_startup.sh. It takes no substitutions,
+        so it lives as the module-level _STARTUP_SCRIPT constant; if variables
+        ever get introduced, switch to a string.Template rather than
+        rebuilding an f-string per call.
 
         Returns:
             Startup script as string
         """
-        script = """#!/bin/bash
-set -eox pipefail
-
-# CAI Application Startup Wrapper
-# This simple script calls the Python entry point which handles all setup
-
-cd /home/cdsw
-
-# Execute the Python startup script
-exec python cai_integration/app_startup.py
-"""
-        return script
+        return _STARTUP_SCRIPT
 
     def wait_for_app_ready(self, app_id: str, timeout: int = 300) -> bool:
         """Wait for application to be ready.
@@ -209,8 +277,12 @@ exec python cai_integration/app_startup.py
         """
         logger.info(f"Waiting for application {app_id} to be ready...")
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        # Exponential backoff: poll quickly at first so a fast-starting app is
+        # detected almost immediately, then back off to avoid hammering the API
+        deadline = time.monotonic() + timeout
+        sleep = 1.0
+        last_status = None
+        while True:
             try:
                 result = self.make_request(
                     "GET", f"projects/{self.project_id}/applications/{app_id}"
@@ -223,13 +295,28 @@ exec python cai_integration/app_startup.py
                         logger.info("Application is running")
                         return True
 
-                    logger.info(f"Application status: {status}")
+                    if status in ("failed", "stopped"):
+                        logger.error(f"Application reached terminal status: {status}")
+                        return False
 
-                time.sleep(10)
+                    logger.info(f"Application status: {status}")
+                    if status != last_status:
+                        # A state transition often precedes another; poll
+                        # quickly again before backing off
+                        last_status = status
+                        sleep = 1.0
 
             except Exception as e:
                 logger.warning(f"Error checking application status: {e}")
-                time.sleep(10)
+
+            # Read the clock once per iteration; it feeds both the deadline
+            # check and the sleep clamp
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            # Jitter avoids synchronized polling across concurrent deploys
+            time.sleep(min(sleep + random.uniform(0, sleep * 0.1), deadline - now))
+            sleep = min(15.0, sleep * 1.5)
 
         logger.error("Timeout waiting for application to be ready")
         return False
@@ -253,8 +340,21 @@ exec python cai_integration/app_startup.py
             "created_at": app.get("created_at"),
         }
 
-        with open(output_path, "w") as f:
-            json.dump(info, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(info, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(info, indent=2).encode()
+
+        # Write to a temp file and rename so readers never see a torn file,
+        # even if this process is SIGTERM'd mid-write on CML shutdown
+        tmp_path = output_path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, output_path)
 
         logger.info(f"Connection info saved to {output_path}")
         logger.info(f"Guardrails server URL: {info['url']}")
@@ -262,6 +362,16 @@ exec python cai_integration/app_startup.py
 
 def main():
     """Main deployment function."""
+    parser = argparse.ArgumentParser(
+        description="Deploy NeMo Guardrails server as a CAI Application"
+    )
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="Block until the application reports running (default: return immediately)",
+    )
+    args = parser.parse_args()
+
     # Get environment variables from CAI built-in variables
     # CDSW_DOMAIN: CAI domain (e.g., "ml-xxxxx.cloudera.site")
     # CDSW_APIV2_KEY: CAI API key
@@ -281,9 +391,8 @@ def main():
         sys.exit(1)
 
     try:
-        logger.info("=" * 60)
-        logger.info("Starting NeMo Guardrails deployment")
-        logger.info("=" * 60)
+        # One log record per banner instead of three separate handler dispatches
+        logger.info("\n%s\nStarting NeMo Guardrails deployment\n%s", _BANNER, _BANNER)
 
         # Create deployer
         deployer = GuardrailsDeployer(
@@ -301,17 +410,25 @@ def main():
             logger.error("No application ID returned from API")
             sys.exit(1)
 
-        # Wait for application to be ready
-        if not deployer.wait_for_app_ready(app_id):
-            logger.error("Application failed to start")
-            sys.exit(1)
-
-        # Save connection info
+        # Save connection info immediately so downstream steps are not blocked
+        # on the application's (potentially slow) startup
         deployer.save_connection_info(app)
 
-        logger.info("=" * 60)
-        logger.info("Deployment completed successfully")
-        logger.info("=" * 60)
+        if args.wait:
+            # Optionally block until the application is serving, refreshing
+            # the saved connection info with the final status
+            if not deployer.wait_for_app_ready(app_id):
+                logger.error("Application failed to start")
+                sys.exit(1)
+
+            result = deployer.make_request(
+                "GET", f"projects/{deployer.project_id}/applications/{app_id}"
+            )
+            deployer.save_connection_info(result or app)
+        else:
+            logger.info("Application is starting in the background (use --wait to block)")
+
+        logger.info("\n%s\nDeployment completed successfully\n%s", _BANNER, _BANNER)
 
     except Exception as e:
         logger.error(f"Deployment failed: {e}", exc_info=True)
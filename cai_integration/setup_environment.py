@@ -13,7 +13,6 @@ The actual setup logic is in setup_environment.sh which:
 """
 
 import subprocess
-import sys
 from pathlib import Path
 
 
@@ -26,12 +25,11 @@ def main():
     # Ensure script is executable
     bash_script.chmod(0o755)
 
-    # Run bash script
+    # Run bash script. stdout/stderr are deliberately left inherited (no
+    # capture_output/PIPE) so pip's install logs stream to the job console
+    # line by line instead of buffering in this process until completion.
     print(f"Executing setup script: {bash_script}")
-    result = subprocess.run(
-        ["bash", str(bash_script)],
-        cwd=str(project_root)
-    )
+    result = subprocess.run(["bash", str(bash_script)], cwd=str(project_root))
 
     if result.returncode != 0:
         raise RuntimeError(f"Setup script failed with exit code {result.returncode}")
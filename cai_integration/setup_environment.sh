@@ -27,6 +27,52 @@ check_existing_setup() {
     return 1  # Setup needed
 }
 
+# Fast path: download and extract a venv pre-built once in CI instead of
+# re-running pip resolution on every cold start. Only used when
+# VENV_ARTIFACT_URL is set; GUARDRAILS_BUILD_FROM_SOURCE=1 forces the pip
+# path below even when an artifact is configured.
+try_artifact_setup() {
+    if [ -z "${VENV_ARTIFACT_URL:-}" ] || [ "${GUARDRAILS_BUILD_FROM_SOURCE:-0}" = "1" ]; then
+        return 1
+    fi
+
+    local archive="/tmp/guardrails_venv_artifact.tar.gz"
+    echo "Downloading pre-built venv artifact..."
+    if ! curl -fsSL --retry 3 -o "$archive" "$VENV_ARTIFACT_URL"; then
+        echo "⚠ Artifact download failed (falling back to pip install)"
+        return 1
+    fi
+
+    # Optional integrity pin: refuse a corrupted or substituted archive
+    if [ -n "${VENV_ARTIFACT_SHA256:-}" ]; then
+        if ! echo "${VENV_ARTIFACT_SHA256}  ${archive}" | sha256sum -c - >/dev/null 2>&1; then
+            echo "⚠ Artifact checksum mismatch (falling back to pip install)"
+            rm -f "$archive"
+            return 1
+        fi
+    fi
+
+    # Extract into a staging directory, then swap it into place so a failed
+    # extraction never leaves a half-populated venv at the final path
+    local staging="${VENV_PATH}.staging.$$"
+    mkdir -p "$staging"
+    if ! tar -xzf "$archive" -C "$staging"; then
+        echo "⚠ Artifact extraction failed (falling back to pip install)"
+        rm -rf "$staging"
+        return 1
+    fi
+
+    if [ -d "$VENV_PATH" ]; then
+        OLD_VENV="${VENV_PATH}.old.$$"
+        mv "$VENV_PATH" "$OLD_VENV"
+        rm -rf "$OLD_VENV" &
+        RM_PID=$!
+    fi
+    mv "$staging" "$VENV_PATH"
+    echo "✓ Pre-built venv extracted to $VENV_PATH"
+    return 0
+}
+
 # Check FORCE_REINSTALL flag
 if [ "${FORCE_REINSTALL:-false}" = "true" ]; then
     echo "FORCE_REINSTALL=true, performing full setup..."
@@ -51,13 +97,48 @@ if [ "$SKIP_SETUP" = "true" ]; then
     echo "Environment already configured - setup skipped"
     echo "Virtual environment location: $VENV_PATH"
     echo "=============================================================="
+elif try_artifact_setup; then
+    # Pre-built artifact path: the venv is already fully installed
+    source "$VENV_PATH/bin/activate"
+
+    echo "Verifying installation..."
+    python -c "import nemoguardrails; print(f'NeMo Guardrails version: {nemoguardrails.__version__}')"
+
+    if [ -n "${RM_PID:-}" ]; then
+        wait "$RM_PID" || true
+    fi
+
+    echo "=============================================================="
+    echo "Environment setup completed successfully (pre-built artifact)"
+    echo "Virtual environment location: $VENV_PATH"
+    echo "=============================================================="
 else
     # Full setup path
+    # Kick off the wheel downloads with the system pip right away, so the
+    # network-bound download overlaps with the CPU/FS-bound venv creation
+    WHEEL_CACHE="/tmp/guardrails_wheels"
+    mkdir -p "$WHEEL_CACHE"
+    python3 -m pip download --disable-pip-version-check -d "$WHEEL_CACHE" \
+        "nemoguardrails>=0.9.0" \
+        "fastapi>=0.109.0" \
+        "uvicorn>=0.27.0" \
+        "pyyaml>=6.0.0" \
+        "pydantic>=2.0.0" \
+        "requests>=2.31.0" \
+        > /tmp/guardrails_wheel_download.log 2>&1 &
+    DOWNLOAD_PID=$!
+
     # Check if virtual environment exists
     if [ -d "$VENV_PATH" ]; then
         if [ "${FORCE_REINSTALL:-false}" = "true" ]; then
             echo "Removing existing virtual environment for reinstall..."
-            rm -rf "$VENV_PATH"
+            # Rename the old venv aside so the new one can be created
+            # immediately; the (slow) recursive delete of thousands of files
+            # overlaps with venv creation and dependency installation
+            OLD_VENV="${VENV_PATH}.old.$$"
+            mv "$VENV_PATH" "$OLD_VENV"
+            rm -rf "$OLD_VENV" &
+            RM_PID=$!
             echo "Creating new virtual environment at $VENV_PATH"
             python3 -m venv "$VENV_PATH"
             echo "✓ Virtual environment created successfully"
@@ -77,6 +158,8 @@ else
 
     # Disable --user flag (conflicts with virtualenv)
     export PIP_USER=0
+    # Skip the PyPI version-check round-trip on every pip invocation
+    export PIP_DISABLE_PIP_VERSION_CHECK=1
 
     # Try to upgrade pip (non-critical)
     echo "Attempting to upgrade pip..."
@@ -86,14 +169,39 @@ else
         echo "⚠ Pip upgrade failed (continuing anyway)"
     fi
 
-    # Install dependencies
+    # Prefer uv when it can be installed: its parallel resolver and global
+    # wheel cache install heavy trees like nemoguardrails several times
+    # faster, and --compile-bytecode pays the .pyc cost once at install time
+    # instead of on the server's first import
+    echo "Installing uv (optional fast installer)..."
+    if pip install uv; then
+        INSTALL_CMD=(uv pip install --compile-bytecode)
+        echo "✓ Using uv for dependency installation"
+    else
+        INSTALL_CMD=(pip install --no-input)
+        echo "⚠ uv unavailable, falling back to pip"
+    fi
+
+    # Reuse the pre-downloaded wheels if the background download succeeded;
+    # otherwise install straight from the index as before
+    FIND_LINKS=()
+    if wait "$DOWNLOAD_PID"; then
+        echo "✓ Wheel pre-download finished, installing from local cache"
+        FIND_LINKS=(--find-links "$WHEEL_CACHE")
+    else
+        echo "⚠ Wheel pre-download failed (see /tmp/guardrails_wheel_download.log), installing from index"
+    fi
+
+    # Install all dependencies in one resolver pass instead of six separate
+    # invocations (each of which re-resolves the dependency graph)
     echo "Installing dependencies..."
-    pip install "nemoguardrails>=0.9.0"
-    pip install "fastapi>=0.109.0"
-    pip install "uvicorn>=0.27.0"
-    pip install "pyyaml>=6.0.0"
-    pip install "pydantic>=2.0.0"
-    pip install "requests>=2.31.0"
+    "${INSTALL_CMD[@]}" "${FIND_LINKS[@]}" \
+        "nemoguardrails>=0.9.0" \
+        "fastapi>=0.109.0" \
+        "uvicorn>=0.27.0" \
+        "pyyaml>=6.0.0" \
+        "pydantic>=2.0.0" \
+        "requests>=2.31.0"
 
     echo "✓ All dependencies installed successfully"
 
@@ -101,6 +209,12 @@ else
     echo "Verifying installation..."
     python -c "import nemoguardrails; print(f'NeMo Guardrails version: {nemoguardrails.__version__}')"
 
+    # Make sure the background deletion of the old venv (if any) has finished
+    # before the job exits, so no half-deleted tree is left behind
+    if [ -n "${RM_PID:-}" ]; then
+        wait "$RM_PID" || true
+    fi
+
     echo "=============================================================="
     echo "Environment setup completed successfully"
     echo "Virtual environment location: $VENV_PATH"
@@ -10,17 +10,81 @@ This script:
 
 Pattern: Jobs with parent_job_key dependencies are automatically triggered
 by CAI when the parent succeeds. We only need to trigger the root job.
+
+Sibling branches therefore already run concurrently server-side: CAI
+dispatches every child whose parent succeeded, so there is no client-side
+serial loop to parallelize — the client only polls the root run.
 """
 
 import argparse
-import json
+import atexit
+import functools
+import logging
+import logging.handlers
 import os
+import random
 import sys
 import time
-import yaml
-import requests
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    # Optional C JSON decoder: ~3-5x faster than stdlib on status payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from cai_integration._yaml_cache import load_yaml_cached
+except ImportError:  # run directly as a script rather than as a package module
+    from _yaml_cache import load_yaml_cached
+
+
+# Sentinel returned by make_request for HTTP 304: the resource is unchanged
+# since the last poll, so there is no body to parse
+NOT_MODIFIED = object()
+
+# Configured by main(); routed through logging (same facility as
+# launch_guardrails.py) so the polling loop doesn't flush stdout per line
+logger = logging.getLogger("job_runner")
+
+
+def _flush_logs():
+    """Flush buffered log handlers so batched records become visible now."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+# Name -> id job mapping persisted by create_jobs.py after each pipeline run
+JOB_IDS_PATH = "/tmp/job_ids.json"
+
+# Exponential moving average of past job durations, persisted across runs so
+# the initial poll interval adapts to how long each job historically takes
+EMA_PATH = Path.home() / ".cache" / "cai_jobrunner" / "ema.json"
+_EMA_ALPHA = 0.3
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_job_ids(path: str, mtime_ns: int) -> Dict[str, str]:
+    """Parse the job-ids file, cached per (path, mtime) across run() calls."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+
+    return json.loads(raw)
+
+
+def load_job_ids(path: str = JOB_IDS_PATH) -> Dict[str, str]:
+    """Return the persisted name -> id job mapping, or {} when unavailable."""
+    try:
+        return _parse_job_ids(path, os.stat(path).st_mtime_ns)
+    except (OSError, ValueError):
+        return {}
 
 
 class JobRunner:
@@ -32,8 +96,8 @@ class JobRunner:
         self.api_key = os.environ.get("CML_API_KEY")
 
         if not all([self.cml_host, self.api_key]):
-            print("❌ Error: Missing required environment variables")
-            print("   Required: CML_HOST, CML_API_KEY")
+            logger.error("Missing required environment variables")
+            logger.error("   Required: CML_HOST, CML_API_KEY")
             sys.exit(1)
 
         self.api_url = f"{self.cml_host.rstrip('/')}/api/v2"
@@ -42,36 +106,80 @@ class JobRunner:
             "Accept": "application/json",
             "Authorization": f"Bearer {self.api_key.strip()}",
         }
+        # Persistent session so the polling loops reuse one TLS connection
+        # instead of paying a handshake per poll; transient 5xx are retried
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+            ),
+        )
+        atexit.register(self.session.close)
+        # Per-project cache of the name -> id job mapping: (fetched_at, jobs)
+        self._jobs_cache: Dict[str, tuple] = {}
+        # ETags seen per URL, used for conditional GETs so unchanged status
+        # polls come back as a body-less 304. Not every CML deployment emits
+        # ETags; set CML_DISABLE_CONDITIONAL_GET=1 to opt out entirely.
+        self._etags: Dict[str, str] = {}
+        self._conditional_get = os.environ.get("CML_DISABLE_CONDITIONAL_GET") != "1"
 
     def make_request(
         self, method: str, endpoint: str, data: dict = None, params: dict = None
     ) -> Optional[dict]:
-        """Make an API request to CML."""
+        """Make an API request to CML.
+
+        GETs are conditional: when an ETag is known for the URL it is sent as
+        If-None-Match, and a 304 response returns the NOT_MODIFIED sentinel so
+        callers (the status poll loop) can skip JSON parsing entirely.
+        """
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
 
+        extra_headers = None
+        if self._conditional_get and method == "GET":
+            etag = self._etags.get(url)
+            if etag:
+                extra_headers = {"If-None-Match": etag}
+
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
-                headers=self.headers,
+                headers=extra_headers,
                 json=data,
                 params=params,
-                timeout=30,
+                timeout=(5, 30),
             )
 
+            if response.status_code == 304:
+                return NOT_MODIFIED
+
             if 200 <= response.status_code < 300:
-                if response.text:
+                if self._conditional_get and method == "GET":
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        self._etags[url] = etag
+                if response.content:
                     try:
+                        # orjson decodes the raw bytes directly, skipping the
+                        # text-decoding round-trip of response.json()
+                        if orjson is not None:
+                            return orjson.loads(response.content)
                         return response.json()
-                    except json.JSONDecodeError:
+                    except ValueError:
                         return {}
                 return {}
             else:
-                print(f"❌ API Error ({response.status_code}): {response.text[:200]}")
+                if logger.isEnabledFor(logging.ERROR):
+                    # Only decode/slice the body when the record will be emitted
+                    logger.error("API Error (%d): %s", response.status_code, response.text[:200])
                 return None
 
         except Exception as e:
-            print(f"❌ Request error: {e}")
+            logger.error("Request error: %s", e)
             return None
 
     def load_jobs_config(self, config_path: str = None) -> Dict:
@@ -81,20 +189,36 @@ class JobRunner:
         else:
             config_path = Path(config_path)
 
-        with open(config_path) as f:
-            return yaml.safe_load(f)
+        return load_yaml_cached(str(config_path))
+
+    # How long a cached job listing stays valid; job definitions change rarely
+    _JOBS_CACHE_TTL = 60.0
 
     def list_jobs(self, project_id: str) -> Dict[str, str]:
-        """List all jobs in a project and return name -> ID mapping."""
+        """List all jobs in a project and return name -> ID mapping.
+
+        The mapping is cached per project for a short TTL so repeated name
+        lookups don't refetch the full job list from the API.
+        """
+        cached = self._jobs_cache.get(project_id)
+        if cached and time.monotonic() - cached[0] < self._JOBS_CACHE_TTL:
+            return cached[1]
+
         result = self.make_request("GET", f"projects/{project_id}/jobs")
 
-        if result:
+        if result is NOT_MODIFIED and cached:
+            # Listing unchanged on the server; refresh the TTL and reuse it
+            self._jobs_cache[project_id] = (time.monotonic(), cached[1])
+            return cached[1]
+
+        if result and result is not NOT_MODIFIED:
             jobs = {}
             for job in result.get("jobs", []):
                 job_name = job.get("name", "")
                 job_id = job.get("id", "")
                 if job_name and job_id:
                     jobs[job_name] = job_id
+            self._jobs_cache[project_id] = (time.monotonic(), jobs)
             return jobs
         return {}
 
@@ -118,38 +242,174 @@ class JobRunner:
         result = self.make_request("GET", f"projects/{project_id}/jobs/{job_id}/runs/{run_id}")
         return result
 
+    def _load_durations(self) -> Dict[str, float]:
+        """Load the persisted job-duration EMAs, or {} when unavailable."""
+        try:
+            with open(EMA_PATH, "rb") as f:
+                raw = f.read()
+            if orjson is not None:
+                return orjson.loads(raw)
+            import json
+
+            return json.loads(raw)
+        except (OSError, ValueError):
+            return {}
+
+    def _record_duration(self, job_name: str, duration: float) -> None:
+        """Fold a completed run's duration into the persisted EMA."""
+        durations = self._load_durations()
+        prev = durations.get(job_name)
+        durations[job_name] = (
+            duration if prev is None else _EMA_ALPHA * duration + (1 - _EMA_ALPHA) * prev
+        )
+        try:
+            EMA_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = str(EMA_PATH) + ".tmp"
+            with open(tmp_path, "w") as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(durations).decode())
+                else:
+                    import json
+
+                    json.dump(durations, f)
+            os.replace(tmp_path, EMA_PATH)
+        except OSError:
+            pass  # History is best-effort; polling just starts from 2s next time
+
+    # Whether the deployment exposes a run event stream; probed on first use
+    _events_supported = True
+
+    # Per-read timeout for the event stream: a connection that accepts but
+    # then goes silent hands over to polling instead of holding the wait
+    # hostage for the full job timeout
+    _STREAM_READ_TIMEOUT = 30
+
+    def _wait_via_event_stream(
+        self, project_id: str, job_id: str, run_id: str, deadline: float
+    ) -> Optional[bool]:
+        """Consume the run's SSE event stream until a terminal state.
+
+        Returns True/False for the terminal state, or None when the
+        deployment has no event endpoint or the stream goes quiet (caller
+        falls back to polling against the same monotonic deadline).
+        """
+        if not self._events_supported:
+            return None
+
+        url = f"{self.api_url}/projects/{project_id}/jobs/{job_id}/runs/{run_id}/events"
+        last_status = None
+        try:
+            with self.session.get(
+                url, stream=True, timeout=(5, self._STREAM_READ_TIMEOUT)
+            ) as response:
+                if response.status_code in (404, 501):
+                    # No server-push support on this deployment; remember so
+                    # later waits go straight to polling
+                    self._events_supported = False
+                    return None
+                if not (200 <= response.status_code < 300):
+                    return None
+
+                for line in response.iter_lines():
+                    if time.monotonic() >= deadline:
+                        logger.error("Timeout waiting on event stream")
+                        return False
+                    if not line.startswith(b"data:"):
+                        continue
+                    payload = line[5:].strip()
+                    try:
+                        if orjson is not None:
+                            event = orjson.loads(payload)
+                        else:
+                            import json
+
+                            event = json.loads(payload)
+                    except ValueError:
+                        continue
+
+                    status = event.get("status")
+                    if status and status != last_status:
+                        logger.info("Status: %s", status)
+                        _flush_logs()
+                        last_status = status
+
+                    if status == "succeeded":
+                        logger.info("Job completed successfully")
+                        _flush_logs()
+                        return True
+                    elif status in ["failed", "stopped", "killed"]:
+                        logger.error("Job failed with status: %s", status)
+                        return False
+        except Exception as e:
+            logger.warning("Event stream unavailable (%s), falling back to polling", e)
+        return None
+
     def wait_for_job_completion(
         self, project_id: str, job_id: str, run_id: str, job_name: str, timeout: int = 3600
     ) -> bool:
         """Wait for job to complete."""
-        print(f"⏳ Waiting for job '{job_name}' to complete...")
+        logger.info("Waiting for job '%s' to complete...", job_name)
+
+        # Monotonic clock so the timeout is immune to NTP wall-clock jumps;
+        # the deadline is shared between streaming and polling so a failed
+        # stream attempt eats into the budget instead of restarting it
+        start = time.monotonic()
+        deadline = start + timeout
+
+        # Prefer server push when available: one long-lived connection with
+        # instant terminal-state detection instead of N polls
+        streamed = self._wait_via_event_stream(project_id, job_id, run_id, deadline)
+        if streamed is not None:
+            if streamed:
+                self._record_duration(job_name, time.monotonic() - start)
+            return streamed
 
-        start_time = time.time()
         last_status = None
-
-        while time.time() - start_time < timeout:
+        # Adaptive backoff: poll fast initially and after each state change
+        # (a transition often precedes another), backing off on quiet
+        # stretches. Jobs that historically run long start with a wider
+        # interval (ema/20, clamped) so hour-long jobs see dozens of polls
+        # instead of hundreds, while short jobs stay responsive.
+        ema = self._load_durations().get(job_name)
+        delay = min(60.0, max(2.0, ema / 20.0)) if ema else 2.0
+
+        while (now := time.monotonic()) < deadline:
             result = self.get_job_run_status(project_id, job_id, run_id)
 
-            if result:
+            if result is NOT_MODIFIED:
+                # 304: status unchanged since the last poll, nothing to parse
+                pass
+            elif result:
                 status = result.get("status", "unknown")
 
-                # Only print status updates when it changes
+                # Only log status updates when it changes; skip the elapsed
+                # computation entirely when INFO records are filtered out
                 if status != last_status:
-                    elapsed = int(time.time() - start_time)
-                    print(f"   [{elapsed}s] Status: {status}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("[%ds] Status: %s", int(now - start), status)
+                        # Transitions are worth seeing promptly even with
+                        # the buffering handler in place
+                        _flush_logs()
                     last_status = status
+                    delay = 2.0
 
                 # Terminal states
                 if status == "succeeded":
-                    print(f"✅ Job completed successfully")
+                    logger.info("Job completed successfully")
+                    _flush_logs()
+                    self._record_duration(job_name, time.monotonic() - start)
                     return True
                 elif status in ["failed", "stopped", "killed"]:
-                    print(f"❌ Job failed with status: {status}")
+                    logger.error("Job failed with status: %s", status)
                     return False
 
-            time.sleep(10)
+            # Full jitter: randomize the whole next window (not just a small
+            # offset) so parallel runners watching jobs decorrelate instead
+            # of herding onto the API at the same instants
+            time.sleep(delay)
+            delay = min(60.0, delay * 2) * random.uniform(0.5, 1.0)
 
-        print(f"❌ Timeout waiting for job completion ({timeout}s)")
+        logger.error("Timeout waiting for job completion (%ds)", timeout)
         return False
 
     def get_root_job(self, config: Dict) -> Optional[str]:
@@ -179,70 +439,80 @@ class JobRunner:
         Returns:
             True if root job triggered successfully, False otherwise
         """
-        print("=" * 70)
-        print("🚀 NeMo Guardrails Job Execution")
-        print("=" * 70)
+        banner = "=" * 70
+        logger.info("\n%s\nNeMo Guardrails Job Execution\n%s", banner, banner)
 
         # Load configuration
         config = self.load_jobs_config(jobs_config_path)
 
+        # Normalize the jobs table once into (key, name, parent_key, timeout)
+        # rows; everything below iterates this flat structure instead of
+        # re-walking config.get("jobs", {}) with repeated .get chains
+        jobs = [
+            (key, cfg.get("name", key), cfg.get("parent_job_key"), cfg.get("timeout", 3600))
+            for key, cfg in config.get("jobs", {}).items()
+        ]
+        names_by_key = {key: name for key, name, _parent, _timeout in jobs}
+
         # Find root job (job with no parent)
-        root_job_key = self.get_root_job(config)
+        root = next((row for row in jobs if row[2] is None), None)
 
-        if not root_job_key:
-            print(f"❌ Root job not found in configuration")
+        if root is None:
+            logger.error("Root job not found in configuration")
             return False
 
-        root_job_config = config.get("jobs", {}).get(root_job_key, {})
-        root_job_name = root_job_config.get("name", root_job_key)
+        root_job_key, root_job_name, _, root_timeout = root
 
-        # Look up root job ID by name
-        print(f"\n🔍 Looking up job: {root_job_name}")
-        root_job_id = self.get_job_id_by_name(project_id, root_job_name)
+        # Look up root job ID by name. The CML jobs endpoint returns every job
+        # in one response, so fetch the name -> id mapping once and resolve all
+        # lookups locally instead of issuing one list call per name
+        logger.info("Looking up job: %s", root_job_name)
+        # Fast path: create_jobs.py persists the mapping after every pipeline
+        # run, so a fresh file resolves the root job with zero API calls;
+        # fall back to the jobs API when it is absent or lacks the name
+        root_job_id = load_job_ids().get(root_job_name)
+        if not root_job_id:
+            all_jobs = self.list_jobs(project_id)
+            root_job_id = all_jobs.get(root_job_name)
 
         if not root_job_id:
-            print(f"❌ Job not found in project: {root_job_name}")
-            print("   Make sure jobs are created first (run create_jobs.py)")
+            logger.error("Job not found in project: %s", root_job_name)
+            logger.error("   Make sure jobs are created first (run create_jobs.py)")
             return False
 
-        print(f"   ✅ Found job ID: {root_job_id}")
+        logger.info("Found job ID: %s", root_job_id)
 
         # Display job dependency chain
-        print(f"\n📋 Job dependency chain:")
-        for job_key, job_config in config.get("jobs", {}).items():
-            parent_key = job_config.get("parent_job_key")
-            job_name = job_config.get("name", job_key)
+        logger.info("Job dependency chain:")
+        for _job_key, job_name, parent_key, _timeout in jobs:
             if parent_key:
-                parent_name = config.get("jobs", {}).get(parent_key, {}).get("name", parent_key)
-                print(f"   {parent_name} → {job_name}")
+                logger.info("   %s -> %s", names_by_key.get(parent_key, parent_key), job_name)
             else:
-                print(f"   📍 {job_name} (root)")
+                logger.info("   %s (root)", job_name)
 
-        print(f"\n🔷 Triggering root job: {root_job_name}")
-        print(f"   (Child jobs will auto-trigger via CAI dependencies)\n")
+        logger.info("Triggering root job: %s", root_job_name)
+        logger.info("   (Child jobs will auto-trigger via CAI dependencies)")
 
         # Trigger root job only
         run_id = self.trigger_job(project_id, root_job_id)
 
         if not run_id:
-            print(f"   ❌ Failed to trigger root job\n")
+            logger.error("Failed to trigger root job")
             return False
 
-        print(f"   ✅ Root job triggered: {run_id}\n")
+        logger.info("Root job triggered: %s", run_id)
 
         # Wait for root job completion
-        timeout = root_job_config.get("timeout", 3600)
+        timeout = root_timeout
         if not self.wait_for_job_completion(
             project_id, root_job_id, run_id, root_job_name, timeout
         ):
-            print(f"❌ Root job failed: {root_job_name}")
+            logger.error("Root job failed: %s", root_job_name)
             return False
 
-        print("=" * 70)
-        print("✅ Root Job Completed Successfully!")
-        print("=" * 70)
-        print("\n💡 Note: Child jobs with dependencies will auto-trigger in CAI.")
-        print("   Monitor them in the CAI UI: Jobs > Job Runs\n")
+        logger.info("\n%s\nRoot Job Completed Successfully!\n%s", banner, banner)
+        logger.info("Note: Child jobs with dependencies will auto-trigger in CAI.")
+        logger.info("   Monitor them in the CAI UI: Jobs > Job Runs")
 
         return True
 
@@ -255,18 +525,26 @@ def main():
 
     args = parser.parse_args()
 
+    # Batch log records through a MemoryHandler: one write per batch instead
+    # of a syscall per line in the polling loop. WARNING and above (errors,
+    # terminal failures) flush immediately; atexit close flushes the rest.
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    buffered = logging.handlers.MemoryHandler(
+        capacity=32, flushLevel=logging.WARNING, target=stream
+    )
+    logging.basicConfig(level=logging.INFO, handlers=[buffered])
+    atexit.register(buffered.close)
+
     try:
         runner = JobRunner()
         success = runner.run(args.project_id, args.jobs_config)
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
-        print("\n⚠️  Job execution cancelled by user")
+        logger.warning("Job execution cancelled by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.error("Unexpected error: %s", e, exc_info=True)
         sys.exit(1)
 
 
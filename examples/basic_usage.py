@@ -10,7 +10,17 @@ This example shows how to:
 
 import asyncio
 from pathlib import Path
-from nemo_guardrails_cai import GuardrailsServer, GuardrailsConfig
+
+from nemo_guardrails_cai import GuardrailsConfig, GuardrailsServer
+
+try:
+    # Optional: libuv-based event loop with noticeably lower scheduling
+    # overhead than the default loop once LLM calls are issued concurrently
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
 
 
 async def main():
@@ -24,29 +34,29 @@ async def main():
         config_path=Path("examples/config"),
         llm_model="gpt-3.5-turbo",
         port=8080,  # Default port for CAI
-        log_level="INFO"
+        log_level="INFO",
     )
 
-    print(f"\n📝 Configuration:")
+    print("\n📝 Configuration:")
     print(f"  Config Path: {config.config_path}")
     print(f"  LLM Model: {config.llm_model}")
     print(f"  Port: {config.port}")
 
     # Create server
-    print(f"\n🚀 Starting guardrails server...")
+    print("\n🚀 Starting guardrails server...")
     server = GuardrailsServer(config)
 
     # In production, you would call server.start()
     # For this example, we'll just initialize the rails
     server.initialize_rails()
 
-    print(f"\n✅ Server initialized successfully!")
-    print(f"\n💡 You can now use the server:")
+    print("\n✅ Server initialized successfully!")
+    print("\n💡 You can now use the server:")
     print(f"  - Local: http://localhost:{config.port}")
     print(f"  - OpenAI compatible endpoint: http://localhost:{config.port}/v1")
 
     # Example usage
-    print(f"\n📮 Example request:")
+    print("\n📮 Example request:")
     prompt = "Hello, how can you help me?"
 
     try:
@@ -55,9 +65,9 @@ async def main():
         print(f"  Bot: {response}")
     except Exception as e:
         print(f"\n  Error: {e}")
-        print(f"  Note: Make sure OPENAI_API_KEY is set in environment")
+        print("  Note: Make sure OPENAI_API_KEY is set in environment")
 
-    print(f"\n" + "=" * 60)
+    print("\n" + "=" * 60)
 
 
 if __name__ == "__main__":
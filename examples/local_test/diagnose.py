@@ -1,11 +1,34 @@
 #!/usr/bin/env python3
 """
 Diagnostic script to check NeMo Guardrails configuration.
+
+Heavy imports (nemoguardrails pulls in langchain, FastAPI, pydantic) are
+deferred into the individual checks, and later checks are skipped once an
+earlier one fails, so the common failure paths report in a fraction of a
+second instead of paying seconds of import time first.
 """
 
+import hashlib
+import importlib.util
 import os
 from pathlib import Path
 
+
+def _rails_cache_key(config_dir: Path) -> str:
+    """Digest the config content so the rails cache key tracks actual changes.
+
+    Hashing every YAML and Colang file (in stable order) means unchanged
+    configs reuse the cached LLMRails while any edit — or a different config
+    directory — naturally produces a different key, unlike the old constant
+    "" key which collided across configs.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(config_dir.rglob("*.yml")) + sorted(config_dir.rglob("*.co")):
+        digest.update(str(path.relative_to(config_dir)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
 # Set API key for imports
 if not os.environ.get("OPENAI_API_KEY"):
     os.environ["OPENAI_API_KEY"] = "sk-test"
@@ -15,13 +38,20 @@ print("NeMo Guardrails Configuration Diagnostic")
 print("=" * 70)
 print()
 
-# 1. Check NeMo Guardrails version
+# Whether later (heavier) checks still make sense to run
+can_continue = True
+
+# 1. Check NeMo Guardrails version (presence + metadata only, no import yet)
 print("1. NeMo Guardrails Version:")
 try:
-    import nemoguardrails
-    print(f"   ✅ Version: {nemoguardrails.__version__}")
+    if importlib.util.find_spec("nemoguardrails") is None:
+        raise ImportError("nemoguardrails is not installed")
+    from importlib.metadata import version
+
+    print(f"   ✅ Version: {version('nemoguardrails')}")
 except Exception as e:
     print(f"   ❌ Error: {e}")
+    can_continue = False
 print()
 
 # 2. Check config file
@@ -30,87 +60,115 @@ config_path = Path(__file__).parent / "config.yml"
 prompts_path = Path(__file__).parent / "prompts.yml"
 print(f"   config.yml exists: {config_path.exists()}")
 print(f"   prompts.yml exists: {prompts_path.exists()}")
+if not config_path.exists():
+    can_continue = False
 print()
 
 # 3. Check if configs can be loaded
 print("3. Loading Rails Configuration:")
-try:
-    from nemoguardrails import RailsConfig
-    rails_config = RailsConfig.from_path(str(config_path.parent))
-    print(f"   ✅ Config loaded successfully")
-    print(f"      Models: {[m.model for m in rails_config.models]}")
-    print(f"      Input rails: {rails_config.rails.input.flows if rails_config.rails.input else 'None'}")
-    print(f"      Output rails: {rails_config.rails.output.flows if rails_config.rails.output else 'None'}")
-except Exception as e:
-    print(f"   ❌ Error loading config: {e}")
-    import traceback
-    traceback.print_exc()
+if can_continue:
+    try:
+        from nemoguardrails import RailsConfig
+
+        rails_config = RailsConfig.from_path(str(config_path.parent))
+        print("   ✅ Config loaded successfully")
+        print(f"      Models: {[m.model for m in rails_config.models]}")
+        print(
+            f"      Input rails: {rails_config.rails.input.flows if rails_config.rails.input else 'None'}"
+        )
+        print(
+            f"      Output rails: {rails_config.rails.output.flows if rails_config.rails.output else 'None'}"
+        )
+    except Exception as e:
+        print(f"   ❌ Error loading config: {e}")
+        import traceback
+
+        traceback.print_exc()
+        can_continue = False
+else:
+    print("   ⏭️  Skipped (earlier check failed)")
 print()
 
 # 4. Check app configuration
 print("4. NeMo Guardrails Server App:")
-try:
-    from nemoguardrails.server import api
-    print(f"   api.app type: {type(api.app).__name__}")
-    print(f"   api.app.default_config_id: {api.app.default_config_id}")
-    print(f"   api.app.single_config_mode: {api.app.single_config_mode}")
-    print(f"   api.app.single_config_id: {api.app.single_config_id}")
-    print(f"   api.app.rails_config_path: {api.app.rails_config_path}")
-    print(f"   api.app.disable_chat_ui: {api.app.disable_chat_ui}")
-except Exception as e:
-    print(f"   ❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+if can_continue:
+    try:
+        from nemoguardrails.server import api
+
+        print(f"   api.app type: {type(api.app).__name__}")
+        print(f"   api.app.default_config_id: {api.app.default_config_id}")
+        print(f"   api.app.single_config_mode: {api.app.single_config_mode}")
+        print(f"   api.app.single_config_id: {api.app.single_config_id}")
+        print(f"   api.app.rails_config_path: {api.app.rails_config_path}")
+        print(f"   api.app.disable_chat_ui: {api.app.disable_chat_ui}")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+        import traceback
+
+        traceback.print_exc()
+        can_continue = False
+else:
+    print("   ⏭️  Skipped (earlier check failed)")
 print()
 
 # 5. Check cached rails
 print("5. Cached Rails Instances:")
-try:
-    from nemoguardrails.server.api import llm_rails_instances
-    print(f"   llm_rails_instances type: {type(llm_rails_instances)}")
-    print(f"   Keys: {list(llm_rails_instances.keys())}")
-    print(f"   Number of cached instances: {len(llm_rails_instances)}")
-except Exception as e:
-    print(f"   ❌ Error: {e}")
+if can_continue:
+    try:
+        from nemoguardrails.server.api import llm_rails_instances
+
+        print(f"   llm_rails_instances type: {type(llm_rails_instances)}")
+        print(f"   Keys: {list(llm_rails_instances.keys())}")
+        print(f"   Number of cached instances: {len(llm_rails_instances)}")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+        can_continue = False
+else:
+    print("   ⏭️  Skipped (earlier check failed)")
 print()
 
 # 6. Simulate what test_server.py does
 print("6. Simulating test_server.py Setup:")
-try:
-    from nemoguardrails import RailsConfig, LLMRails
-    from nemoguardrails.server import api
-    from nemoguardrails.server.api import llm_rails_instances
-
-    config_path = Path(__file__).parent
-    config_id = "local_test"
-
-    # Load config
-    rails_config = RailsConfig.from_path(str(config_path))
-    rails = LLMRails(rails_config)
-
-    # Configure app
-    app = api.app
-    app.rails_config_path = str(config_path)
-    app.single_config_mode = True
-    app.single_config_id = config_id
-    app.default_config_id = config_id
-
-    # Cache rails
-    cache_key = ""
-    llm_rails_instances[cache_key] = rails
-
-    print(f"   ✅ Setup simulation successful")
-    print(f"      app.rails_config_path: {app.rails_config_path}")
-    print(f"      app.single_config_mode: {app.single_config_mode}")
-    print(f"      app.single_config_id: {app.single_config_id}")
-    print(f"      app.default_config_id: {app.default_config_id}")
-    print(f"      Cached with key: '{cache_key}'")
-    print(f"      llm_rails_instances keys: {list(llm_rails_instances.keys())}")
-
-except Exception as e:
-    print(f"   ❌ Error during setup: {e}")
-    import traceback
-    traceback.print_exc()
+if can_continue:
+    try:
+        from nemoguardrails import LLMRails, RailsConfig
+        from nemoguardrails.server import api
+        from nemoguardrails.server.api import llm_rails_instances
+
+        config_path = Path(__file__).parent
+        config_id = "local_test"
+
+        # Load config
+        rails_config = RailsConfig.from_path(str(config_path))
+        rails = LLMRails(rails_config)
+
+        # Configure app
+        app = api.app
+        app.rails_config_path = str(config_path)
+        app.single_config_mode = True
+        app.single_config_id = config_id
+        app.default_config_id = config_id
+
+        # Cache rails keyed by config content, so unchanged configs are
+        # reused and edited ones miss instead of serving a stale instance
+        cache_key = _rails_cache_key(config_path)
+        llm_rails_instances[cache_key] = rails
+
+        print("   ✅ Setup simulation successful")
+        print(f"      app.rails_config_path: {app.rails_config_path}")
+        print(f"      app.single_config_mode: {app.single_config_mode}")
+        print(f"      app.single_config_id: {app.single_config_id}")
+        print(f"      app.default_config_id: {app.default_config_id}")
+        print(f"      Cached with key: '{cache_key}'")
+        print(f"      llm_rails_instances keys: {list(llm_rails_instances.keys())}")
+
+    except Exception as e:
+        print(f"   ❌ Error during setup: {e}")
+        import traceback
+
+        traceback.print_exc()
+else:
+    print("   ⏭️  Skipped (earlier check failed)")
 print()
 
 print("=" * 70)
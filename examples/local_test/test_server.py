@@ -13,15 +13,15 @@ Requirements:
     - nemoguardrails installed: pip install nemoguardrails
 """
 
+import importlib.util
+import logging
 import os
 import sys
-import logging
 from pathlib import Path
 
 # Setup logging
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
@@ -39,6 +39,7 @@ def check_requirements():
     # Check if nemoguardrails is installed
     try:
         import nemoguardrails
+
         logger.info(f"✅ NeMo Guardrails version: {nemoguardrails.__version__}")
     except ImportError:
         logger.error("❌ NeMo Guardrails not installed!")
@@ -56,11 +57,8 @@ def check_requirements():
 
 
 def start_server():
-    """Start the guardrails server using NeMo Guardrails CLI."""
+    """Start the guardrails server in-process via uvicorn."""
     try:
-        from pathlib import Path
-        import subprocess
-
         config_path = Path(__file__).parent
         port = int(os.environ.get("CDSW_APP_PORT", 8080))
 
@@ -83,19 +81,30 @@ def start_server():
         logger.info("=" * 70)
         logger.info("")
 
-        # Use the NeMo Guardrails CLI to start the server
-        # This is more reliable than trying to manually configure the FastAPI app
-        cmd = [
-            "nemoguardrails",
-            "server",
-            "--config", str(config_path),
-            "--port", str(port),
-        ]
-
-        logger.info(f"Running: {' '.join(cmd)}")
+        # Run the FastAPI app in-process instead of shelling out to the
+        # nemoguardrails CLI: no fork, no second interpreter start, and the
+        # modules imported by check_requirements are reused
+        import uvicorn
+        from nemoguardrails.server import api
+
+        # Mirror the in-process setup diagnose.py validates: without the
+        # config ids the API cannot resolve which config serves
+        # /v1/chat/completions requests
+        config_id = config_path.name
+        api.app.rails_config_path = str(config_path)
+        api.app.single_config_mode = True
+        api.app.single_config_id = config_id
+        api.app.default_config_id = config_id
+
+        # uvloop and httptools are optional speedups (faster event loop and
+        # HTTP/1.1 parser); uvicorn falls back to the defaults when missing
+        loop = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+        http = "httptools" if importlib.util.find_spec("httptools") else "auto"
+
+        logger.info(f"Running uvicorn in-process (loop={loop}, http={http})")
         logger.info("")
 
-        subprocess.run(cmd, check=False)
+        uvicorn.run(api.app, host="0.0.0.0", port=port, loop=loop, http=http, log_level="info")
 
     except KeyboardInterrupt:
         logger.info("\n👋 Server stopped")
@@ -7,11 +7,23 @@ using locally hosted models in CAI.
 import logging
 from typing import Optional
 
-from nemo_guardrails_cai.models.registry import ModelRegistry
+from nemo_guardrails_cai.models.registry import get_registry
+from nemo_guardrails_cai.utils import aretry_with_backoff
 
 logger = logging.getLogger(__name__)
 
 
+@aretry_with_backoff(max_retries=2, initial_delay=0.05, max_delay=0.5, total_deadline_s=1.0)
+async def _predict_with_retry(model_name: str, text: str) -> dict:
+    """Run a registry prediction, retrying transient failures.
+
+    The budget is kept tight (at most ~1s of retrying) so a flapping
+    model delays rather than stalls the guardrails flow; persistent
+    failures still propagate to the callers' fail-safe handling.
+    """
+    return await get_registry().predict_async(model_name, text)
+
+
 async def check_jailbreak_local(context: Optional[dict] = None) -> bool:
     """Check for jailbreak attempts using locally hosted model.
 
@@ -35,11 +47,11 @@ async def check_jailbreak_local(context: Optional[dict] = None) -> bool:
             logger.warning("No user message in context")
             return False
 
-        logger.info(f"Checking for jailbreak: {user_message[:100]}...")
+        logger.debug("Checking for jailbreak: %.100s...", user_message)
 
         # Get the jailbreak detection model from registry
         model_name = context.get("jailbreak_model", "jailbreak_detector")
-        registry = ModelRegistry()
+        registry = get_registry()
         model = registry.get_model(model_name)
 
         if model is None:
@@ -47,10 +59,12 @@ async def check_jailbreak_local(context: Optional[dict] = None) -> bool:
             # Fail safe: allow the message if model not available
             return False
 
-        # Run prediction
-        result = model.predict_single(user_message)
+        # Run prediction through the shared micro-batching queue (memoized
+        # per model/text pair, so repeated checks skip the forward pass;
+        # concurrent checks coalesce into one batched forward)
+        result = await _predict_with_retry(model_name, user_message)
 
-        logger.info(f"Jailbreak check result: {result}")
+        logger.debug("Jailbreak check result: %s", result)
 
         # Return True if jailbreak detected (content is unsafe)
         is_jailbreak = not result.get("is_safe", True)
@@ -86,11 +100,11 @@ async def check_toxicity_local(context: Optional[dict] = None) -> bool:
             logger.warning("No user message in context")
             return False
 
-        logger.info(f"Checking for toxicity: {user_message[:100]}...")
+        logger.debug("Checking for toxicity: %.100s...", user_message)
 
         # Get the toxicity detection model from registry
         model_name = context.get("toxicity_model", "toxicity_detector")
-        registry = ModelRegistry()
+        registry = get_registry()
         model = registry.get_model(model_name)
 
         if model is None:
@@ -98,10 +112,10 @@ async def check_toxicity_local(context: Optional[dict] = None) -> bool:
             # Fail safe: allow the message if model not available
             return False
 
-        # Run prediction
-        result = model.predict_single(user_message)
+        # Run prediction through the shared micro-batching queue
+        result = await _predict_with_retry(model_name, user_message)
 
-        logger.info(f"Toxicity check result: {result}")
+        logger.debug("Toxicity check result: %s", result)
 
         # Return True if toxic content detected
         is_toxic = not result.get("is_safe", True)
@@ -145,10 +159,10 @@ async def check_with_local_model(
                 logger.warning("No text found in context")
                 return {"is_safe": True, "score": 0.0, "label": "unknown"}
 
-        logger.info(f"Checking with model '{model_name}': {text[:100]}...")
+        logger.debug("Checking with model '%s': %.100s...", model_name, text)
 
         # Get the model from registry
-        registry = ModelRegistry()
+        registry = get_registry()
         model = registry.get_model(model_name)
 
         if model is None:
@@ -156,10 +170,10 @@ async def check_with_local_model(
             # Fail safe: return safe result if model not available
             return {"is_safe": True, "score": 0.0, "label": "model_not_found"}
 
-        # Run prediction
-        result = model.predict_single(text)
+        # Run prediction through the shared micro-batching queue
+        result = await _predict_with_retry(model_name, text)
 
-        logger.info(f"Check result: {result}")
+        logger.debug("Check result: %s", result)
 
         return result
 
@@ -176,7 +190,6 @@ def register_actions():
 
     Call this function when initializing the guardrails server.
     """
-    from nemoguardrails import RailsConfig
 
     # Actions are automatically discovered by NeMo Guardrails
     # if they are defined in this module
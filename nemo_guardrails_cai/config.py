@@ -2,9 +2,14 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, List, Optional
+
 import yaml
 
+# Cached YAML parsing (libyaml C loader, in-process LRU plus JSON sidecar)
+# is shared with the CAI integration scripts
+from cai_integration._yaml_cache import load_yaml_cached as _read_yaml_cached
+
 
 @dataclass
 class GuardrailsConfig:
@@ -39,6 +44,12 @@ class GuardrailsConfig:
         default_factory=dict
     )  # Local model configurations
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the cached to_dict() snapshot."""
+        if name != "_cached_dict":
+            object.__setattr__(self, "_cached_dict", None)
+        object.__setattr__(self, name, value)
+
     @classmethod
     def from_yaml(cls, yaml_path: str) -> "GuardrailsConfig":
         """Load configuration from YAML file.
@@ -49,8 +60,7 @@ class GuardrailsConfig:
         Returns:
             GuardrailsConfig instance
         """
-        with open(yaml_path, "r") as f:
-            config_dict = yaml.safe_load(f)
+        config_dict = _read_yaml_cached(yaml_path)
 
         # Extract relevant fields
         config_path = config_dict.get("config_path", "config")
@@ -76,10 +86,18 @@ class GuardrailsConfig:
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary.
 
+        The nested dictionary is built once and cached; any attribute
+        assignment invalidates it (see __setattr__), so hot paths like
+        health endpoints and config reloads reuse the snapshot. Callers
+        must treat the returned dictionary as read-only.
+
         Returns:
             Configuration as dictionary
         """
-        return {
+        if self._cached_dict is not None:
+            return self._cached_dict
+
+        self._cached_dict = {
             "config_path": str(self.config_path),
             "server": {
                 "host": self.host,
@@ -97,6 +115,7 @@ class GuardrailsConfig:
             "additional_config": self.additional_config,
             "local_models": self.local_models,
         }
+        return self._cached_dict
 
     def save(self, yaml_path: str) -> None:
         """Save configuration to YAML file.
@@ -104,5 +123,8 @@ class GuardrailsConfig:
         Args:
             yaml_path: Path to save YAML configuration
         """
+        # Prefer the libyaml C dumper when available; safe_dump's
+        # pure-Python emitter is an order of magnitude slower
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
         with open(yaml_path, "w") as f:
-            yaml.safe_dump(self.to_dict(), f, default_flow_style=False)
+            yaml.dump(self.to_dict(), f, Dumper=dumper, default_flow_style=False)
@@ -2,10 +2,12 @@
 
 from nemo_guardrails_cai.models.base import BaseModelService
 from nemo_guardrails_cai.models.huggingface import HuggingFaceModelService
+from nemo_guardrails_cai.models.onnx import OnnxModelService
 from nemo_guardrails_cai.models.registry import ModelRegistry
 
 __all__ = [
     "BaseModelService",
     "HuggingFaceModelService",
+    "OnnxModelService",
     "ModelRegistry",
 ]
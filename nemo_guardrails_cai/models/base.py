@@ -1,8 +1,8 @@
 """Base model service interface for locally hosted models."""
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
 import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +76,30 @@ class BaseModelService(ABC):
         """Check if model is loaded."""
         return self.model is not None
 
+    def backbone_key(self) -> tuple:
+        """Key identifying services that can share one loaded backbone.
+
+        Two services with equal keys run the exact same weights, so the
+        registry loads the checkpoint once and shares it between them
+        (e.g. two checks on the same classifier with different
+        thresholds). Subclasses extend the key with any option that
+        changes the loaded weights.
+        """
+        return (self.__class__.__name__, self.model_name, self.device)
+
+    def adopt_backbone(self, other: "BaseModelService") -> None:
+        """Share another service's already-loaded model and tokenizer.
+
+        Only valid between services with equal backbone_key(); per-service
+        settings like threshold and labels stay independent.
+
+        Args:
+            other: A loaded service to share the backbone of
+        """
+        self.model = other.model
+        self.tokenizer = other.tokenizer
+        logger.info(f"{self.__class__.__name__} sharing backbone '{self.model_name}'")
+
     def unload(self) -> None:
         """Unload the model from memory."""
         self.model = None
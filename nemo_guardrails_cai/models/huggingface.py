@@ -1,7 +1,12 @@
 """HuggingFace model service implementation."""
 
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import threading
+from typing import Any, Dict, List
+
+import numpy as np
 import torch
 
 from nemo_guardrails_cai.models.base import BaseModelService
@@ -23,63 +28,236 @@ class HuggingFaceModelService(BaseModelService):
     - Custom jailbreak detection models
     """
 
+    # Labels that indicate unsafe content; class-level frozenset so the
+    # safety check does a hash probe instead of rebuilding a set per call
+    UNSAFE_LABELS = frozenset(
+        {
+            "unsafe",
+            "toxic",
+            "jailbreak",
+            "harmful",
+            "negative",
+            "attack",
+            "malicious",
+        }
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize HuggingFace model service.
 
         Args:
             config: Configuration dictionary containing:
                 - model_name: HuggingFace model name or local path
-                - device: 'cpu', 'cuda', or 'mps'
+                - device: 'cpu', 'cuda', 'cuda:N', or 'mps'
                 - task_type: 'classification', 'ner', etc.
                 - labels: List of label names (optional)
                 - use_fast_tokenizer: Whether to use fast tokenizer (default: True)
+                - compile: Whether to apply BetterTransformer/torch.compile
+                  at load time (default: False; compilation pays off on GPU
+                  or long-running CPU services, not one-off scripts)
+                - precision: 'fp32', 'fp16', 'bf16' or 'int8' (default:
+                  fp32). fp16/bf16 apply on CUDA, int8 applies dynamic
+                  quantization on CPU; unsupported combinations fall back
+                  to fp32 with a warning.
+                - cuda_graphs: Whether to capture a CUDA graph of the
+                  fixed-shape single-text forward at load time (default:
+                  False; CUDA only, replay removes per-kernel launch
+                  overhead for predict_single-style checks)
+                - direct_inference: Whether batches run through direct
+                  tokenize + model() calls instead of the transformers
+                  pipeline (default: True; set False to restore the
+                  pipeline's per-bucket path)
+                - share_memory: Whether CPU model weights are moved into
+                  shared memory after load (default: False). Load the
+                  model before forking server workers and each worker
+                  then maps the same physical copy instead of paying the
+                  weights N times.
         """
         super().__init__(config)
         self.task_type = config.get("task_type", "classification")
         self.labels = config.get("labels", ["safe", "unsafe"])
+        self._labels_lower = [label.lower() for label in self.labels]
         self.use_fast_tokenizer = config.get("use_fast_tokenizer", True)
+        self.compile_model = config.get("compile", False)
+        self.precision = config.get("precision", "fp32")
+        self.use_cuda_graphs = config.get("cuda_graphs", False)
+        self.direct_inference = config.get("direct_inference", True)
+        self.share_weights = config.get("share_memory", False)
+        self._cuda_graph = None
         self._pipeline = None
+        self._encode = None
+        self._pinned_ids = None
+        self._pinned_mask = None
+        # Serializes forwards that touch the shared pinned staging buffers
+        # or the CUDA-graph static tensors; concurrent batches (batcher
+        # and executor threads) must not interleave writes to them
+        self._forward_lock = threading.Lock()
+        # Models emit a handful of distinct raw labels, so memoizing the
+        # "LABEL_%d" parsing leaves one dict hit per element in the batch
+        # post-processing loop; rebuilt whenever set_labels() changes the
+        # mapping
+        self._map_label_cached = functools.lru_cache(maxsize=64)(self._map_label)
 
     def load(self) -> None:
         """Load the HuggingFace model and tokenizer."""
         try:
-            from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
+            from transformers import AutoModelForSequenceClassification, pipeline
 
             logger.info(f"Loading HuggingFace model: {self.model_name}")
 
-            # Determine device
-            if self.device == "cuda" and torch.cuda.is_available():
-                device = 0  # First GPU
-                logger.info("Using CUDA device")
+            # Fast tokenizers disable their Rust-side parallelism once a
+            # fork is observed unless told otherwise; batch encoding
+            # benefits from keeping it on
+            os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+            # Warm the page cache for local weight shards in parallel so
+            # from_pretrained doesn't serialize on cold disk reads
+            from nemo_guardrails_cai.utils import prefetch_model_files
+
+            prefetch_model_files(self.model_name)
+
+            # Determine device; "cuda:N" comes from the registry's VRAM
+            # placement planner and selects a specific GPU index
+            if self.device.startswith("cuda") and torch.cuda.is_available():
+                device = int(self.device.split(":", 1)[1]) if ":" in self.device else 0
+                logger.info(f"Using CUDA device {device}")
             elif self.device == "mps" and torch.backends.mps.is_available():
                 device = "mps"
                 logger.info("Using MPS device (Apple Silicon)")
             else:
                 device = -1  # CPU
                 logger.info("Using CPU device")
+            on_cuda = isinstance(device, int) and device >= 0
+
+            # Load tokenizer (shared across services using the same
+            # checkpoint; see ModelRegistry.get_or_load_tokenizer)
+            from nemo_guardrails_cai.models.registry import ModelRegistry
 
-            # Load tokenizer
-            self.tokenizer = AutoTokenizer.from_pretrained(
+            self.tokenizer = ModelRegistry.get_or_load_tokenizer(
                 self.model_name, use_fast=self.use_fast_tokenizer
             )
             logger.info("Tokenizer loaded successfully")
 
             # Load model
             if self.task_type == "classification":
-                self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+                # Reduced precision: loading directly in the target dtype
+                # halves the bytes moved per weight fetch and avoids a full
+                # fp32 intermediate copy of the model
+                model_kwargs = {}
+                if on_cuda and self.precision in ("fp16", "bf16"):
+                    if self.precision == "bf16" and torch.cuda.is_bf16_supported():
+                        model_kwargs["torch_dtype"] = torch.bfloat16
+                    else:
+                        model_kwargs["torch_dtype"] = torch.float16
+                    logger.info(f"Loading model in {self.precision}")
+                elif on_cuda and self.precision == "int8":
+                    # 8-bit weights on GPU via bitsandbytes: check models
+                    # are bandwidth-bound, so quartering weight bytes is a
+                    # direct latency win; requires bitsandbytes installed
+                    import importlib.util as _importlib_util
+
+                    if _importlib_util.find_spec("bitsandbytes") is not None:
+                        model_kwargs["load_in_8bit"] = True
+                        logger.info("Loading model with 8-bit weights (bitsandbytes)")
+                    else:
+                        logger.warning(
+                            "bitsandbytes not installed; loading in fp32 "
+                            "(pip install bitsandbytes for int8 on CUDA)"
+                        )
+                elif self.precision != "fp32" and self.precision != "int8":
+                    logger.warning(
+                        f"Precision '{self.precision}' not supported on {self.device}, "
+                        "falling back to fp32"
+                    )
+
+                self.model = AutoModelForSequenceClassification.from_pretrained(
+                    self.model_name, **model_kwargs
+                )
+                # Inference-only service: disable dropout/batch-norm
+                # training behaviour up front
+                self.model.eval()
                 logger.info("Classification model loaded successfully")
 
-                # Create pipeline for easier inference
+                if device == -1 and self.precision == "int8":
+                    try:
+                        # Dynamic int8 quantization of the Linear layers:
+                        # int8 GEMMs hit the VNNI path on modern x86
+                        self.model = torch.quantization.quantize_dynamic(
+                            self.model, {torch.nn.Linear}, dtype=torch.qint8
+                        )
+                        logger.info("Applied int8 dynamic quantization")
+                    except Exception as e:
+                        logger.warning(f"int8 quantization unavailable: {e}")
+
+                if device == -1 and self.share_weights:
+                    try:
+                        # Move weights into shared memory so processes
+                        # forked after load (e.g. uvicorn workers) map one
+                        # physical copy instead of duplicating it each
+                        self.model.share_memory()
+                        logger.info("Moved model weights into shared memory")
+                    except Exception as e:
+                        logger.warning(f"Could not share model weights: {e}")
+
+                if self.compile_model:
+                    self.model = self._apply_compilation(self.model)
+
+                # Create pipeline for easier inference; 8-bit models are
+                # already dispatched by accelerate and transformers rejects
+                # an explicit device argument for them
+                pipeline_kwargs = {}
+                if "load_in_8bit" not in model_kwargs:
+                    pipeline_kwargs["device"] = device
                 self._pipeline = pipeline(
                     "text-classification",
                     model=self.model,
                     tokenizer=self.tokenizer,
-                    device=device,
                     max_length=self.max_length,
                     truncation=True,
+                    **pipeline_kwargs,
                 )
                 logger.info("Pipeline created successfully")
 
+                # Memoized tokenization: canned guardrail prompts and
+                # repeated user messages hit an O(1) dict lookup instead of
+                # re-running the tokenizer on every call
+                self._encode = functools.lru_cache(maxsize=2048)(
+                    lambda text: self.tokenizer(
+                        text,
+                        truncation=True,
+                        max_length=self.max_length,
+                        return_tensors="pt",
+                    )
+                )
+
+                if on_cuda:
+                    try:
+                        # Pinned host staging buffers: batches copy into
+                        # page-locked memory once and ride a non-blocking
+                        # H2D transfer instead of paying pageable->pinned
+                        # staging on every call
+                        self._pinned_ids = torch.empty(
+                            (self._PINNED_BATCH, self.max_length),
+                            dtype=torch.long,
+                            pin_memory=True,
+                        )
+                        self._pinned_mask = torch.empty_like(self._pinned_ids)
+                        logger.info("Allocated pinned host buffers for batch inputs")
+                    except Exception as e:
+                        logger.warning(f"Pinned-memory allocation unavailable: {e}")
+
+                if self.use_cuda_graphs and on_cuda:
+                    self._capture_cuda_graph()
+
+                if self.compile_model:
+                    try:
+                        # Trigger compilation/autotune now, before the service
+                        # accepts traffic, so the first request doesn't pay it
+                        self._pipeline(["warmup"] * 2, batch_size=2)
+                        logger.info("Warmup forward passes completed")
+                    except Exception as e:
+                        logger.warning(f"Warmup forward failed: {e}")
+
             else:
                 raise ValueError(f"Unsupported task type: {self.task_type}")
 
@@ -95,6 +273,233 @@ class HuggingFaceModelService(BaseModelService):
             logger.error(f"Failed to load model {self.model_name}: {e}")
             raise
 
+    def backbone_key(self) -> tuple:
+        """Extend the shared-backbone key with weight-shaping options."""
+        return super().backbone_key() + (self.precision, self.compile_model)
+
+    def adopt_backbone(self, other: "HuggingFaceModelService") -> None:
+        """Share a loaded model, pipeline and encoding cache.
+
+        The per-service tokenization cache is rebuilt against this
+        service's max_length; threshold, labels and batching settings
+        stay independent of the donor.
+        """
+        super().adopt_backbone(other)
+        self._pipeline = other._pipeline
+        self._encode = functools.lru_cache(maxsize=2048)(
+            lambda text: self.tokenizer(
+                text,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="pt",
+            )
+        )
+
+    def _apply_compilation(self, model):
+        """Apply fused-attention and graph compilation to the model.
+
+        Both steps are best-effort: optimum may not be installed and
+        torch.compile may not support the platform, in which case the eager
+        model is returned unchanged.
+        """
+        try:
+            from optimum.bettertransformer import BetterTransformer
+
+            model = BetterTransformer.transform(model)
+            logger.info("Applied BetterTransformer fused attention")
+        except Exception as e:
+            logger.warning(f"BetterTransformer unavailable: {e}")
+
+        try:
+            model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+            logger.info("Compiled model with torch.compile")
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable: {e}")
+
+        return model
+
+    # Length buckets are aligned to multiples of this many tokens
+    _BUCKET_WIDTH = 32
+
+    # Row capacity of the pinned host staging buffers
+    _PINNED_BATCH = 32
+
+    def _bucketed_inference(self, texts: List[str]) -> List[Any]:
+        """Run the pipeline per length bucket, preserving input order.
+
+        The pipeline pads every sequence in a batch to the longest one, so a
+        mixed batch of short and long texts spends most of its FLOPs on pad
+        tokens. Sorting by tokenized length and running one forward per
+        bucket (max length rounded up to _BUCKET_WIDTH) keeps padding waste
+        bounded by the bucket width.
+        """
+        lengths = self.tokenizer(
+            texts,
+            truncation=True,
+            max_length=self.max_length,
+            return_length=True,
+            add_special_tokens=True,
+        )["length"]
+
+        order = sorted(range(len(texts)), key=lambda i: lengths[i])
+        results: List[Any] = [None] * len(texts)
+        start = 0
+        while start < len(order):
+            width = self._BUCKET_WIDTH
+            cap = -(-max(lengths[order[start]], 1) // width) * width
+            end = start
+            while end < len(order) and lengths[order[end]] <= cap:
+                end += 1
+            idx = order[start:end]
+            if self.direct_inference:
+                bucket_results = self._forward_batch([texts[i] for i in idx])
+            else:
+                bucket_results = self._pipeline([texts[i] for i in idx], batch_size=len(idx))
+            for i, result in zip(idx, bucket_results):
+                results[i] = result
+            start = end
+
+        return results
+
+    def _capture_cuda_graph(self) -> None:
+        """Capture a CUDA graph of the fixed-shape single-text forward.
+
+        Allocates static input/output tensors padded to max_length, warms
+        the model up, then records one forward pass; predict_single-style
+        calls replay the recorded graph with a single launch instead of
+        hundreds of individual kernel launches. Best-effort: capture
+        failures (unsupported ops, older GPUs) leave the eager path in
+        place.
+        """
+        try:
+            # Allocate the static tensors on the GPU the model landed on,
+            # which may not be cuda:0 under the placement planner
+            model_device = next(self.model.parameters()).device
+            self._static_ids = torch.zeros(
+                1, self.max_length, dtype=torch.long, device=model_device
+            )
+            self._static_mask = torch.zeros_like(self._static_ids)
+            with torch.inference_mode():
+                for _ in range(3):
+                    self.model(input_ids=self._static_ids, attention_mask=self._static_mask)
+                torch.cuda.synchronize()
+                graph = torch.cuda.CUDAGraph()
+                with torch.cuda.graph(graph):
+                    self._static_logits = self.model(
+                        input_ids=self._static_ids, attention_mask=self._static_mask
+                    ).logits
+            self._cuda_graph = graph
+            logger.info("Captured CUDA graph for single-text inference")
+        except Exception as e:
+            self._cuda_graph = None
+            logger.warning(f"CUDA graph capture unavailable: {e}")
+
+    def _forward_batch(self, batch_texts: List[str]) -> List[Dict[str, Any]]:
+        """Tokenize and classify a batch with one direct forward pass.
+
+        Skips the transformers pipeline wrapper: one padded tokenizer
+        call, one self.model() call, softmax over the batch. Returns the
+        pipeline's {'label', 'score'} shape per text.
+        """
+        enc = self.tokenizer(
+            batch_texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="pt",
+        )
+        try:
+            device = next(self.model.parameters()).device
+        except StopIteration:
+            device = torch.device("cpu")
+
+        # Stage through the pinned buffers when the batch fits and the
+        # encoding carries only ids/mask; otherwise plain device copies.
+        # The buffers are shared per instance, so the staging copy, H2D
+        # transfer and forward all stay under the lock — a concurrent
+        # batch must not overwrite the host rows before this one's async
+        # transfer has been consumed
+        if (
+            self._pinned_ids is not None
+            and set(enc.keys()) <= {"input_ids", "attention_mask"}
+            and enc["input_ids"].shape[0] <= self._pinned_ids.shape[0]
+            and enc["input_ids"].shape[1] <= self._pinned_ids.shape[1]
+        ):
+            with self._forward_lock:
+                rows, cols = enc["input_ids"].shape
+                ids = self._pinned_ids[:rows, :cols]
+                mask = self._pinned_mask[:rows, :cols]
+                ids.copy_(enc["input_ids"])
+                mask.copy_(enc["attention_mask"])
+                enc = {
+                    "input_ids": ids.to(device, non_blocking=True),
+                    "attention_mask": mask.to(device, non_blocking=True),
+                }
+                with torch.inference_mode():
+                    logits = self.model(**enc).logits
+                    probs = torch.softmax(logits, dim=-1)
+                # The .cpu() sync also fences the pinned rows for reuse
+                probs = probs.float().cpu()
+        else:
+            enc = {k: v.to(device) for k, v in enc.items()}
+            with torch.inference_mode():
+                logits = self.model(**enc).logits
+                probs = torch.softmax(logits, dim=-1)
+            probs = probs.float().cpu()
+        id2label = getattr(self.model.config, "id2label", {}) or {}
+        batch_results = []
+        for row in probs:
+            idx = int(row.argmax())
+            batch_results.append(
+                {"label": id2label.get(idx, f"LABEL_{idx}"), "score": float(row[idx])}
+            )
+        return batch_results
+
+    def _predict_direct(self, text: str) -> Dict[str, Any]:
+        """Classify one text via cached encodings and a direct forward pass.
+
+        Bypasses the transformers pipeline: the encoding comes from the
+        LRU tokenization cache and the logits are computed with a single
+        self.model(**batch) call, skipping the pipeline's per-call Python
+        bookkeeping. Returns the same {'label', 'score'} shape the
+        pipeline produces so downstream post-processing is unchanged.
+        """
+        if self._cuda_graph is not None:
+            # Replay the captured graph: copy the padded encoding into the
+            # static tensors and relaunch the whole forward in one call
+            enc = self.tokenizer(
+                text,
+                truncation=True,
+                padding="max_length",
+                max_length=self.max_length,
+                return_tensors="pt",
+            )
+            # The static tensors are shared per instance, so the copy,
+            # replay and readout must not interleave across threads
+            with self._forward_lock:
+                with torch.inference_mode():
+                    self._static_ids.copy_(enc["input_ids"])
+                    self._static_mask.copy_(enc["attention_mask"])
+                    self._cuda_graph.replay()
+                    probs = torch.softmax(self._static_logits, dim=-1)
+                    scores = probs[0].float().cpu()
+        else:
+            enc = self._encode(text)
+            try:
+                device = next(self.model.parameters()).device
+            except StopIteration:
+                device = torch.device("cpu")
+            batch = {k: v.to(device) for k, v in enc.items()}
+
+            with torch.inference_mode():
+                logits = self.model(**batch).logits
+                probs = torch.softmax(logits, dim=-1)
+
+            scores = probs[0].cpu()
+        idx = int(scores.argmax())
+        id2label = getattr(self.model.config, "id2label", {}) or {}
+        return {"label": id2label.get(idx, f"LABEL_{idx}"), "score": float(scores[idx])}
+
     def predict(self, texts: List[str]) -> List[Dict[str, Any]]:
         """Run prediction on a batch of texts.
 
@@ -107,38 +512,50 @@ class HuggingFaceModelService(BaseModelService):
         if not self.is_loaded():
             raise RuntimeError("Model not loaded. Call load() first.")
 
+        if not texts:
+            return []
+
         try:
-            # Run inference
-            results = self._pipeline(texts, batch_size=self.batch_size)
-
-            # Process results
-            predictions = []
-            for result in results:
-                # Handle different output formats
-                if isinstance(result, list):
-                    # Multiple labels returned
-                    result = result[0]
-
-                label = result.get("label", "LABEL_0")
-                score = result.get("score", 0.0)
-
-                # Map labels to meaningful names
-                label_name = self._map_label(label)
-
-                # Determine if content is safe
-                is_safe = self._determine_safety(label_name, score)
-
-                predictions.append(
-                    {
-                        "label": label_name,
-                        "score": float(score),
-                        "is_safe": is_safe,
-                        "raw_label": label,
-                        "threshold": self.threshold,
-                    }
-                )
+            # Run inference; multi-text batches go through length bucketing
+            # so heterogeneous inputs don't all pad to the longest sequence,
+            # single texts take the direct (cached-encoding) path
+            # inference_mode also skips autograd's view/version tracking,
+            # which no_grad (what the pipeline uses internally) still pays
+            with torch.inference_mode():
+                if len(texts) > 1:
+                    results = self._bucketed_inference(texts)
+                elif self._encode is not None:
+                    results = [self._predict_direct(texts[0])]
+                else:
+                    results = self._pipeline(texts, batch_size=self.batch_size)
+
+            # Process results: pull labels/scores out once, then decide
+            # safety for the whole batch with one vectorized boolean
+            # expression instead of a per-result _determine_safety call
+            flat = [result[0] if isinstance(result, list) else result for result in results]
+            raw_labels = [result.get("label", "LABEL_0") for result in flat]
+            labels = [self._map_label_cached(raw) for raw in raw_labels]
+            scores = np.fromiter(
+                (result.get("score", 0.0) for result in flat), dtype=np.float64, count=len(flat)
+            )
 
-            return predictions
+            # _map_label already lowercases, so membership is a bare probe
+            # of the class-level frozenset
+            unsafe = np.fromiter(
+                (label in self.UNSAFE_LABELS for label in labels), dtype=bool, count=len(labels)
+            )
+            is_safe = ~(unsafe & (scores > self.threshold))
+
+            return [
+                {
+                    "label": label,
+                    "score": float(score),
+                    "is_safe": bool(safe),
+                    "raw_label": raw,
+                    "threshold": self.threshold,
+                }
+                for label, score, safe, raw in zip(labels, scores, is_safe, raw_labels)
+            ]
 
         except Exception as e:
             logger.error(f"Prediction failed: {e}")
@@ -157,8 +574,8 @@ class HuggingFaceModelService(BaseModelService):
         if raw_label.startswith("LABEL_"):
             try:
                 idx = int(raw_label.split("_")[1])
-                if idx < len(self.labels):
-                    return self.labels[idx]
+                if idx < len(self._labels_lower):
+                    return self._labels_lower[idx]
             except (ValueError, IndexError):
                 pass
 
@@ -175,26 +592,9 @@ class HuggingFaceModelService(BaseModelService):
         Returns:
             True if content is safe, False otherwise
         """
-        # Labels that indicate unsafe content
-        unsafe_labels = {
-            "unsafe",
-            "toxic",
-            "jailbreak",
-            "harmful",
-            "negative",
-            "attack",
-            "malicious",
-        }
-
-        # Check if label indicates unsafe content
-        is_unsafe_label = label.lower() in unsafe_labels
-
-        # If unsafe label with high confidence, mark as unsafe
-        if is_unsafe_label and score > self.threshold:
-            return False
-
-        # Otherwise, consider safe
-        return True
+        # Labels arrive pre-lowercased from _map_label; unsafe with high
+        # confidence means unsafe, anything else is considered safe
+        return not (label in self.UNSAFE_LABELS and score > self.threshold)
 
     def set_labels(self, labels: List[str]) -> None:
         """Update label mapping.
@@ -203,6 +603,13 @@ class HuggingFaceModelService(BaseModelService):
             labels: List of label names in order
         """
         self.labels = labels
+        self._labels_lower = [label.lower() for label in labels]
+        self._map_label_cached = functools.lru_cache(maxsize=64)(self._map_label)
+        # Memoized registry predictions embed the mapped label, so results
+        # computed under the old mapping are now stale
+        from nemo_guardrails_cai.models.registry import clear_prediction_cache
+
+        clear_prediction_cache()
         logger.info(f"Updated labels to: {labels}")
 
     def set_threshold(self, threshold: float) -> None:
@@ -215,4 +622,9 @@ class HuggingFaceModelService(BaseModelService):
             raise ValueError("Threshold must be between 0 and 1")
 
         self.threshold = threshold
+        # Memoized registry predictions embed is_safe/threshold, so
+        # results computed under the old threshold are now stale
+        from nemo_guardrails_cai.models.registry import clear_prediction_cache
+
+        clear_prediction_cache()
         logger.info(f"Updated threshold to: {threshold}")
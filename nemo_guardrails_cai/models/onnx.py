@@ -0,0 +1,166 @@
+"""ONNX Runtime model service implementation."""
+
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+
+from nemo_guardrails_cai.models.base import BaseModelService
+
+logger = logging.getLogger(__name__)
+
+
+class OnnxModelService(BaseModelService):
+    """ONNX Runtime model service for classification models.
+
+    Runs transformer classifiers through onnxruntime via optimum, which
+    fuses the attention/FFN graph ahead of time and typically cuts CPU
+    inference latency by 2-3x versus eager PyTorch. Models are exported
+    on the fly from their HuggingFace checkpoints the first time they are
+    loaded.
+
+    Example configuration:
+        models:
+          jailbreak_detector:
+            type: onnx
+            model_name: "protectai/deberta-v3-base-prompt-injection-v2"
+            device: cpu
+            threshold: 0.7
+    """
+
+    # Labels that indicate unsafe content (mirrors HuggingFaceModelService)
+    UNSAFE_LABELS = frozenset(
+        {
+            "unsafe",
+            "toxic",
+            "jailbreak",
+            "harmful",
+            "negative",
+            "attack",
+            "malicious",
+        }
+    )
+
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize ONNX model service.
+
+        Args:
+            config: Configuration dictionary containing:
+                - model_name: HuggingFace model name or local path
+                - device: 'cpu', 'cuda' or 'cuda:N'
+                - labels: List of label names (optional)
+                - use_fast_tokenizer: Whether to use fast tokenizer (default: True)
+        """
+        super().__init__(config)
+        self.labels = config.get("labels", ["safe", "unsafe"])
+        self._labels_lower = [label.lower() for label in self.labels]
+        self.use_fast_tokenizer = config.get("use_fast_tokenizer", True)
+        self._id2label = {}
+
+    def load(self) -> None:
+        """Load the model through optimum's ONNX Runtime wrapper."""
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+
+            from nemo_guardrails_cai.models.registry import ModelRegistry
+
+            logger.info(f"Loading ONNX model: {self.model_name}")
+
+            self.tokenizer = ModelRegistry.get_or_load_tokenizer(
+                self.model_name, use_fast=self.use_fast_tokenizer
+            )
+            logger.info("Tokenizer loaded successfully")
+
+            # "cuda:N" comes from the registry's VRAM placement planner;
+            # the GPU index travels through provider_options
+            use_cuda = self.device.startswith("cuda")
+            provider = "CUDAExecutionProvider" if use_cuda else "CPUExecutionProvider"
+            provider_options = None
+            if use_cuda and ":" in self.device:
+                provider_options = {"device_id": int(self.device.split(":", 1)[1])}
+            # export=True converts the checkpoint to ONNX on first load;
+            # subsequent loads reuse the exported graph from the HF cache
+            self.model = ORTModelForSequenceClassification.from_pretrained(
+                self.model_name, export=True, provider=provider, provider_options=provider_options
+            )
+            self._id2label = getattr(self.model.config, "id2label", {}) or {}
+
+            logger.info(f"ONNX model {self.model_name} loaded with {provider}")
+
+        except ImportError:
+            logger.error(
+                "optimum[onnxruntime] is required for ONNX models. "
+                "Install with: pip install optimum[onnxruntime]"
+            )
+            raise
+        except Exception as e:
+            logger.error(f"Failed to load ONNX model {self.model_name}: {e}")
+            raise
+
+    def predict(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run prediction on a batch of texts.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of prediction results
+        """
+        if not self.is_loaded():
+            raise RuntimeError("Model not loaded. Call load() first.")
+
+        if not texts:
+            return []
+
+        try:
+            enc = self.tokenizer(
+                texts,
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np",
+            )
+            logits = self.model(**enc).logits
+            logits = np.asarray(logits, dtype=np.float64)
+
+            # Softmax + vectorized safety decision over the whole batch
+            shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+            probs = shifted / shifted.sum(axis=1, keepdims=True)
+            labels_idx = probs.argmax(axis=1)
+            scores = probs[np.arange(len(texts)), labels_idx]
+
+            labels = [self._map_label(int(idx)) for idx in labels_idx]
+            unsafe = np.fromiter(
+                (label in self.UNSAFE_LABELS for label in labels), dtype=bool, count=len(labels)
+            )
+            is_safe = ~(unsafe & (scores > self.threshold))
+
+            return [
+                {
+                    "label": label,
+                    "score": float(score),
+                    "is_safe": bool(safe),
+                    "raw_label": self._id2label.get(int(idx), f"LABEL_{int(idx)}"),
+                    "threshold": self.threshold,
+                }
+                for label, score, safe, idx in zip(labels, scores, is_safe, labels_idx)
+            ]
+
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}")
+            raise
+
+    def _map_label(self, idx: int) -> str:
+        """Map a label index to a meaningful lowercased name.
+
+        Args:
+            idx: Label index from the model output
+
+        Returns:
+            Mapped label name
+        """
+        if idx < len(self._labels_lower):
+            return self._labels_lower[idx]
+
+        raw = self._id2label.get(idx, f"LABEL_{idx}")
+        return str(raw).lower()
@@ -1,14 +1,184 @@
 """Model registry for managing multiple locally hosted models."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
 from nemo_guardrails_cai.models.base import BaseModelService
 from nemo_guardrails_cai.models.huggingface import HuggingFaceModelService
+from nemo_guardrails_cai.models.onnx import OnnxModelService
 
 logger = logging.getLogger(__name__)
 
 
+def get_registry() -> "ModelRegistry":
+    """Return the process-wide ModelRegistry instance.
+
+    All registry state lives on the class, so the module-level instance
+    created below is purely a convenience handle; hot actions resolve it
+    through a plain global read instead of constructing anything.
+    """
+    return _registry
+
+
+# Memoized prediction results keyed by (model name, text), shared by the
+# sync and async prediction paths and bounded by simple LRU eviction
+_PREDICTION_CACHE_SIZE = 4096
+_prediction_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+
+
+def _cache_get(key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """Look up a memoized prediction, refreshing its LRU position."""
+    result = _prediction_cache.get(key)
+    if result is not None:
+        _prediction_cache.move_to_end(key)
+    return result
+
+
+def _cache_put(key: Tuple[str, str], result: Dict[str, Any]) -> None:
+    """Store a prediction, evicting the least recently used on overflow."""
+    _prediction_cache[key] = result
+    _prediction_cache.move_to_end(key)
+    if len(_prediction_cache) > _PREDICTION_CACHE_SIZE:
+        _prediction_cache.popitem(last=False)
+
+
+def clear_prediction_cache() -> None:
+    """Drop all memoized prediction results.
+
+    Cached entries embed is_safe and threshold, so anything that changes
+    what a model would answer — (re-)registration, unregistration, or a
+    threshold/label update on a live service — must call this.
+    """
+    _prediction_cache.clear()
+
+
+class BatchingPredictor:
+    """Coalesce concurrent single-text predictions into batched forwards.
+
+    Concurrent guardrail checks each used to pay a full model forward.
+    Requests are queued as (text, future) pairs; a background task drains
+    them until a batch fills or the latency window closes, runs one
+    predict() call off the event loop and fans the results back to the
+    waiting futures — the same micro-batching pattern the standalone
+    model service uses for its /predict endpoint.
+
+    Pending requests are grouped into length buckets (estimated at ~4
+    bytes per token, rounded to _BUCKET_WIDTH) and the fullest bucket is
+    flushed first, so each batch pads to its bucket's maximum rather
+    than the longest text in a mixed batch; remaining buckets stay
+    queued for the next flush.
+    """
+
+    # Bucket granularity in estimated tokens; the byte-length heuristic
+    # avoids tokenizing every text twice just to route it
+    _BUCKET_WIDTH = 32
+
+    def __init__(
+        self,
+        model: BaseModelService,
+        max_batch_size: int = 8,
+        batch_timeout_ms: float = 5.0,
+        check_latency_budget_ms: float = 250.0,
+        max_concurrent_batches: int = 4,
+    ):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.batch_timeout = batch_timeout_ms / 1000.0
+        self.latency_budget = check_latency_budget_ms / 1000.0
+        self.max_concurrent_batches = max_concurrent_batches
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, text: str) -> Dict[str, Any]:
+        """Queue one text and await its slice of the batched results."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            # The queue and semaphore bind to the loop they were first used
+            # on; a predictor outliving that loop (repeated asyncio.run,
+            # tests) would otherwise hang every later submit, so rebuild
+            # them on the current loop
+            self.queue = asyncio.Queue()
+            self._in_flight = asyncio.Semaphore(self.max_concurrent_batches)
+            self._task = loop.create_task(self._worker())
+            self._loop = loop
+        future = loop.create_future()
+        # Each request carries its SLO deadline so the drain loop can
+        # flush early instead of letting a fill wait eat the whole budget
+        await self.queue.put((text, future, loop.time() + self.latency_budget))
+        return await future
+
+    def stop(self) -> None:
+        """Cancel the background drain task, if running."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @classmethod
+    def _bucket_of(cls, text: str) -> int:
+        """Map a text to its estimated-length bucket."""
+        return (len(text) // 4) // cls._BUCKET_WIDTH
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        buckets: Dict[int, List[Tuple[str, asyncio.Future, float]]] = defaultdict(list)
+        while True:
+            if not buckets:
+                item = await self.queue.get()
+                buckets[self._bucket_of(item[0])].append(item)
+
+            fill_deadline = loop.time() + self.batch_timeout
+            while all(len(pending) < self.max_batch_size for pending in buckets.values()):
+                # Admission control: stop filling once the most urgent
+                # queued request could no longer absorb another wait round
+                # without blowing its SLO deadline
+                earliest = min(
+                    item_deadline
+                    for pending in buckets.values()
+                    for _text, _future, item_deadline in pending
+                )
+                remaining = min(fill_deadline, earliest - self.batch_timeout) - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                buckets[self._bucket_of(item[0])].append(item)
+
+            # Flush the fullest bucket; the rest wait for the next round.
+            # The semaphore caps in-flight batches so a burst can't pile
+            # forward passes onto the executor and collapse throughput.
+            fullest = max(buckets, key=lambda key: len(buckets[key]))
+            batch = buckets.pop(fullest)
+            await self._in_flight.acquire()
+            task = loop.create_task(self._run_batch(batch))
+            task.add_done_callback(lambda _task: self._in_flight.release())
+
+    async def _run_batch(self, batch: List[Tuple[str, "asyncio.Future", float]]) -> None:
+        loop = asyncio.get_running_loop()
+        texts = [text for text, _future, _deadline in batch]
+        try:
+            results = await loop.run_in_executor(None, self.model.predict, texts)
+        except Exception as e:
+            for _text, future, _deadline in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_text, future, _deadline), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
 class ModelRegistry:
     """Registry for managing multiple model services.
 
@@ -19,14 +189,28 @@ class ModelRegistry:
     - Custom check models
     """
 
-    _instance: Optional["ModelRegistry"] = None
+    # Mutations go through _models under _models_lock and publish a fresh
+    # read-only snapshot into _models_view; the hot lookup path reads the
+    # snapshot without taking any lock (copy-on-write: registrations are
+    # rare, lookups happen on every guardrail check)
     _models: Dict[str, BaseModelService] = {}
-
-    def __new__(cls):
-        """Singleton pattern to ensure one registry instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    _models_view: Mapping[str, BaseModelService] = MappingProxyType({})
+    _models_lock = threading.Lock()
+    _batchers: Dict[str, BatchingPredictor] = {}
+    # list_models() memo: (version, result) pair, served while no
+    # registration, load or eviction has bumped the version counter
+    _version: int = 0
+    _list_cache: Optional[Tuple[int, Dict[str, Dict[str, Any]]]] = None
+    # Resident-set management: at most _resident_cap models loaded at once
+    # (0 disables the cap); pinned models are never evicted
+    _resident_cap: int = 0
+    _pinned: set = set()
+    _last_used: Dict[str, float] = {}
+    # Tokenizers shared across services, keyed by (model name, use_fast):
+    # two checks backed by the same checkpoint reuse one vocab instead of
+    # paying the memory and load time twice
+    _tokenizer_cache: Dict[Tuple[str, bool], Any] = {}
+    _tokenizer_lock = threading.Lock()
 
     @classmethod
     def register_model(
@@ -46,11 +230,13 @@ class ModelRegistry:
         Raises:
             ValueError: If model type is not supported
         """
-        logger.info(f"Registering model '{name}' of type '{model_type}'")
+        logger.info("Registering model '%s' of type '%s'", name, model_type)
 
         # Create model service based on type
         if model_type == "huggingface":
             model_service = HuggingFaceModelService(config)
+        elif model_type == "onnx":
+            model_service = OnnxModelService(config)
         else:
             raise ValueError(f"Unsupported model type: {model_type}")
 
@@ -58,14 +244,24 @@ class ModelRegistry:
         if auto_load:
             try:
                 model_service.load()
-                logger.info(f"Model '{name}' loaded successfully")
+                logger.info("Model '%s' loaded successfully", name)
             except Exception as e:
-                logger.error(f"Failed to load model '{name}': {e}")
+                logger.error("Failed to load model '%s': %s", name, e)
                 raise
 
-        # Store in registry
-        cls._models[name] = model_service
-        logger.info(f"Model '{name}' registered successfully")
+        # Store in registry and publish a new read snapshot
+        with cls._models_lock:
+            cls._models[name] = model_service
+            cls._models_view = MappingProxyType(dict(cls._models))
+        logger.info("Model '%s' registered successfully", name)
+
+        # A (re-)registered model may answer differently than its
+        # predecessor, so drop memoized predictions and any stale batcher
+        clear_prediction_cache()
+        cls._version += 1
+        stale = cls._batchers.pop(name, None)
+        if stale is not None:
+            stale.stop()
 
         return model_service
 
@@ -79,24 +275,37 @@ class ModelRegistry:
         Returns:
             Model service or None if not found
         """
-        return cls._models.get(name)
+        # Lock-free read against the immutable snapshot
+        return cls._models_view.get(name)
 
     @classmethod
     def list_models(cls) -> Dict[str, Dict[str, Any]]:
         """List all registered models.
 
+        The result (including each model's loaded flag) is memoized
+        against a version counter that every registration, lazy load and
+        eviction bumps, so health/models endpoints polling this at high
+        frequency rebuild it only after an actual change. Callers must
+        treat the returned dictionary as read-only.
+
         Returns:
             Dictionary mapping model names to their info
         """
-        return {
+        cached = cls._list_cache
+        if cached is not None and cached[0] == cls._version:
+            return cached[1]
+
+        info = {
             name: {
                 "type": model.__class__.__name__,
                 "loaded": model.is_loaded(),
                 "model_name": model.model_name,
                 "device": model.device,
             }
-            for name, model in cls._models.items()
+            for name, model in cls._models_view.items()
         }
+        cls._list_cache = (cls._version, info)
+        return info
 
     @classmethod
     def unregister_model(cls, name: str) -> bool:
@@ -111,11 +320,18 @@ class ModelRegistry:
         if name in cls._models:
             model = cls._models[name]
             model.unload()
-            del cls._models[name]
-            logger.info(f"Model '{name}' unregistered")
+            with cls._models_lock:
+                del cls._models[name]
+                cls._models_view = MappingProxyType(dict(cls._models))
+            clear_prediction_cache()
+            cls._version += 1
+            batcher = cls._batchers.pop(name, None)
+            if batcher is not None:
+                batcher.stop()
+            logger.info("Model '%s' unregistered", name)
             return True
 
-        logger.warning(f"Model '{name}' not found in registry")
+        logger.warning("Model '%s' not found in registry", name)
         return False
 
     @classmethod
@@ -125,6 +341,73 @@ class ModelRegistry:
             cls.unregister_model(name)
         logger.info("All models unregistered")
 
+    @classmethod
+    def get_or_load_tokenizer(cls, model_name: str, use_fast: bool = True) -> Any:
+        """Return a process-wide shared tokenizer for a checkpoint.
+
+        Args:
+            model_name: HuggingFace model name or local path
+            use_fast: Whether to use the fast (Rust) tokenizer
+
+        Returns:
+            The shared tokenizer instance
+        """
+        key = (model_name, use_fast)
+        tokenizer = cls._tokenizer_cache.get(key)
+        if tokenizer is None:
+            with cls._tokenizer_lock:
+                tokenizer = cls._tokenizer_cache.get(key)
+                if tokenizer is None:
+                    from transformers import AutoTokenizer
+
+                    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=use_fast)
+                    cls._tokenizer_cache[key] = tokenizer
+        return tokenizer
+
+    @classmethod
+    def configure_residency(cls, resident_cap: int = 0, pinned=()) -> None:
+        """Configure how many models may stay loaded at once.
+
+        Args:
+            resident_cap: Maximum number of loaded models (0 = unlimited)
+            pinned: Model names that are never evicted (hot detectors)
+        """
+        cls._resident_cap = resident_cap
+        cls._pinned = set(pinned)
+        logger.info(
+            "Residency: cap=%s, pinned=%s", resident_cap or "unlimited", sorted(cls._pinned)
+        )
+
+    @classmethod
+    def _ensure_resident(cls, name: str, model: BaseModelService) -> None:
+        """Lazily load a model, evicting cold ones past the resident cap.
+
+        Marks the model as recently used; if it is unloaded, the least
+        recently used non-pinned models are unloaded first until the
+        resident cap has room, then the model is loaded. Frequently used
+        detectors stay warm while rarely used custom checks pay a reload
+        only when they actually run.
+        """
+        cls._last_used[name] = time.monotonic()
+        if model.is_loaded():
+            return
+
+        if cls._resident_cap > 0:
+            loaded = [n for n, m in cls._models_view.items() if m.is_loaded()]
+            while len(loaded) >= cls._resident_cap:
+                victims = [n for n in loaded if n not in cls._pinned and n != name]
+                if not victims:
+                    break
+                victim = min(victims, key=lambda n: cls._last_used.get(n, 0.0))
+                cls._models_view[victim].unload()
+                loaded.remove(victim)
+                cls._version += 1
+                logger.info("Evicted cold model '%s' to stay under resident cap", victim)
+
+        logger.info("Lazy-loading model '%s'", name)
+        model.load()
+        cls._version += 1
+
     @classmethod
     def health_check(cls) -> Dict[str, Any]:
         """Check health status of all registered models.
@@ -132,15 +415,21 @@ class ModelRegistry:
         Returns:
             Health status dictionary
         """
+        models = cls._models_view
         return {
-            "total_models": len(cls._models),
-            "models": {name: model.health_check() for name, model in cls._models.items()},
+            "total_models": len(models),
+            "models": {name: model.health_check() for name, model in models.items()},
         }
 
     @classmethod
     def predict(cls, model_name: str, text: str) -> Dict[str, Any]:
         """Run prediction using a registered model.
 
+        Results are memoized in the shared (model, text) cache: guardrails
+        flows often run several checks over the same user message within
+        one conversation turn, and repeats skip the forward pass entirely.
+        Callers must treat the returned dictionary as read-only.
+
         Args:
             model_name: Name of the model to use
             text: Input text
@@ -149,17 +438,131 @@ class ModelRegistry:
             Prediction result
 
         Raises:
-            ValueError: If model not found
-            RuntimeError: If model not loaded
+            ValueError: If model not found (unloaded models are loaded
+                lazily via the residency policy)
         """
+        key = (model_name, text)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
         model = cls.get_model(model_name)
         if model is None:
             raise ValueError(f"Model '{model_name}' not found in registry")
 
-        if not model.is_loaded():
-            raise RuntimeError(f"Model '{model_name}' is not loaded")
+        cls._ensure_resident(model_name, model)
 
-        return model.predict_single(text)
+        result = model.predict_single(text)
+        _cache_put(key, result)
+        return result
+
+    @classmethod
+    async def predict_async(cls, model_name: str, text: str) -> Dict[str, Any]:
+        """Run a prediction through the shared micro-batching queue.
+
+        Concurrent callers of the same model are coalesced into one
+        batched forward pass (see BatchingPredictor); results are
+        memoized in the same (model, text) cache as the sync predict path.
+        Batching behaviour comes from the model config: 'max_batch_size'
+        (default 8), 'batch_timeout_ms' (default 5),
+        'check_latency_budget_ms' (default 250) and
+        'max_concurrent_batches' (default 4).
+
+        Args:
+            model_name: Name of the model to use
+            text: Input text
+
+        Returns:
+            Prediction result
+
+        Raises:
+            ValueError: If model not found (unloaded models are loaded
+                lazily via the residency policy)
+        """
+        key = (model_name, text)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        model = cls.get_model(model_name)
+        if model is None:
+            raise ValueError(f"Model '{model_name}' not found in registry")
+
+        if model.is_loaded():
+            cls._ensure_resident(model_name, model)
+        else:
+            # Lazy loads are heavyweight; keep them off the event loop
+            await asyncio.to_thread(cls._ensure_resident, model_name, model)
+
+        batcher = cls._batchers.get(model_name)
+        if batcher is None:
+            batcher = BatchingPredictor(
+                model,
+                max_batch_size=model.config.get("max_batch_size", 8),
+                batch_timeout_ms=model.config.get("batch_timeout_ms", 5.0),
+                check_latency_budget_ms=model.config.get("check_latency_budget_ms", 250.0),
+                max_concurrent_batches=model.config.get("max_concurrent_batches", 4),
+            )
+            cls._batchers[model_name] = batcher
+
+        result = await batcher.submit(text)
+        _cache_put(key, result)
+        return result
+
+    @classmethod
+    def _plan_gpu_placement(cls, models_config: Dict[str, Any]) -> Dict[str, str]:
+        """Assign cuda models to GPUs based on declared VRAM needs.
+
+        Models that request cuda and declare 'vram_size_mb' are placed
+        largest-first onto the GPU with the most free memory that still
+        fits them (with 10% headroom for activations); models that fit
+        nowhere fall back to CPU instead of OOM-ing whichever loads
+        second. Models without a vram_size_mb keep their configured
+        device.
+
+        Args:
+            models_config: The 'models' section of the configuration
+
+        Returns:
+            Mapping of model name to resolved device string
+        """
+        requests = {
+            name: model_config.get("vram_size_mb")
+            for name, model_config in models_config.items()
+            if str(model_config.get("device", "")).startswith("cuda")
+            and model_config.get("vram_size_mb")
+        }
+        if not requests:
+            return {}
+
+        try:
+            import torch
+
+            if not torch.cuda.is_available():
+                return {}
+            free = {}
+            for gpu in range(torch.cuda.device_count()):
+                free_bytes, _total = torch.cuda.mem_get_info(gpu)
+                free[gpu] = free_bytes / (1024 * 1024)
+        except Exception as e:
+            logger.warning("Could not query GPU memory, keeping configured devices: %s", e)
+            return {}
+
+        placements = {}
+        # Biggest models first so they get first pick of free VRAM
+        for name, need_mb in sorted(requests.items(), key=lambda item: item[1], reverse=True):
+            headroom = need_mb * 1.1
+            candidates = [gpu for gpu, free_mb in free.items() if free_mb >= headroom]
+            if candidates:
+                gpu = max(candidates, key=lambda g: free[g])
+                free[gpu] -= headroom
+                placements[name] = f"cuda:{gpu}"
+            else:
+                placements[name] = "cpu"
+                logger.warning("No GPU has %sMB free for model '%s'; placing on CPU", need_mb, name)
+
+        logger.info("GPU placement plan: %s", placements)
+        return placements
 
     @classmethod
     def load_from_config(cls, config: Dict[str, Any]) -> None:
@@ -172,6 +575,7 @@ class ModelRegistry:
                     type: huggingface
                     model_name: "my-org/jailbreak-bert"
                     device: cuda
+                    vram_size_mb: 2048  # optional, enables VRAM budgeting
                     threshold: 0.7
                   toxicity_detector:
                     type: huggingface
@@ -184,19 +588,81 @@ class ModelRegistry:
             logger.warning("No models configured")
             return
 
-        logger.info(f"Loading {len(models_config)} models from configuration")
+        logger.info("Loading %d models from configuration", len(models_config))
+
+        # Optional residency policy: cap loaded models and pin hot ones
+        if "resident_cap" in config or "pinned_models" in config:
+            cls.configure_residency(
+                resident_cap=config.get("resident_cap", 0),
+                pinned=config.get("pinned_models", ()),
+            )
+
+        # Resolve cuda placements against actual free VRAM before loading
+        placements = cls._plan_gpu_placement(models_config)
 
+        # Register metadata first (cheap), then run the heavy load() calls
+        # concurrently: N models no longer pay N x load_time on cold start
+        to_load = []
         for name, model_config in models_config.items():
             try:
+                if name in placements:
+                    model_config["device"] = placements[name]
                 model_type = model_config.pop("type", "huggingface")
                 auto_load = model_config.pop("auto_load", True)
 
-                cls.register_model(
-                    name=name, model_type=model_type, config=model_config, auto_load=auto_load
+                model_service = cls.register_model(
+                    name=name, model_type=model_type, config=model_config, auto_load=False
                 )
+                if auto_load:
+                    to_load.append((name, model_service))
             except Exception as e:
-                logger.error(f"Failed to load model '{name}': {e}")
+                logger.error("Failed to load model '%s': %s", name, e)
                 # Continue loading other models
                 continue
 
-        logger.info(f"Successfully loaded {len(cls._models)} models")
+        if to_load:
+            # Services resolving to identical weights (same checkpoint,
+            # device and precision — see backbone_key) load once; the
+            # rest adopt the shared backbone instead of paying a
+            # duplicate load and a duplicate copy in memory
+            groups: Dict[tuple, List[Tuple[str, BaseModelService]]] = defaultdict(list)
+            for name, model_service in to_load:
+                groups[model_service.backbone_key()].append((name, model_service))
+
+            # Same-device loads stay serialized (concurrent loads onto one
+            # GPU thrash the CUDA allocator); different devices overlap
+            device_sems: Dict[str, threading.Semaphore] = defaultdict(
+                lambda: threading.Semaphore(1)
+            )
+
+            def _load(model_service: BaseModelService) -> None:
+                with device_sems[str(model_service.device)]:
+                    model_service.load()
+
+            with ThreadPoolExecutor(max_workers=min(4, len(groups))) as pool:
+                futures = {pool.submit(_load, group[0][1]): group for group in groups.values()}
+                for future in as_completed(futures):
+                    group = futures[future]
+                    primary_name, primary = group[0]
+                    try:
+                        future.result()
+                        logger.info("Model '%s' loaded successfully", primary_name)
+                        for name, model_service in group[1:]:
+                            model_service.adopt_backbone(primary)
+                            logger.info("Model '%s' shares backbone with '%s'", name, primary_name)
+                    except Exception as e:
+                        # Every service in the group would fail the same way
+                        for name, _model_service in group:
+                            logger.error("Failed to load model '%s': %s", name, e)
+                            cls.unregister_model(name)
+
+            # The direct load() calls above change loaded flags without
+            # going through register/unregister
+            cls._version += 1
+
+        logger.info("Successfully loaded %d models", len(cls._models))
+
+
+# Module-level registry handle returned by get_registry(); creating it
+# here replaces the old __new__-based singleton
+_registry = ModelRegistry()
@@ -2,10 +2,11 @@
 
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Optional
 
-from nemoguardrails import LLMRails, RailsConfig
+from nemoguardrails import LLMRails
 from nemoguardrails.server import api
 
 from nemo_guardrails_cai.config import GuardrailsConfig
@@ -38,9 +39,11 @@ class GuardrailsServer:
         self.config = config
         self.rails: Optional[LLMRails] = None
 
-        # Setup logging
+        # Setup logging; resolve the level name once instead of on every
+        # place that needs the numeric value
+        self._log_level = getattr(logging, config.log_level)
         logging.basicConfig(
-            level=getattr(logging, config.log_level),
+            level=self._log_level,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         )
         logger.info(f"Initializing Guardrails Server with config: {config}")
@@ -69,8 +72,11 @@ class GuardrailsServer:
                 logger.error(f"Failed to initialize local models: {e}")
                 # Continue without local models
 
-        # Load guardrails configuration
-        rails_config = RailsConfig.from_path(str(self.config.config_path))
+        # Load guardrails configuration (cached on disk, keyed by the
+        # config files' mtimes, so restarts skip the full re-parse)
+        from nemo_guardrails_cai.utils import load_rails_config_cached
+
+        rails_config = load_rails_config_cached(self.config.config_path)
 
         # Override LLM configuration if provided
         if self.config.llm_model:
@@ -100,8 +106,43 @@ class GuardrailsServer:
         except Exception as e:
             logger.warning(f"Could not register custom actions: {e}")
 
+        # Warm the check models so the first real request does not pay
+        # kernel autotuning and allocator warm-up
+        self._warmup()
+
         logger.info("Guardrails initialized successfully")
 
+    def _warmup(self) -> None:
+        """Run synthetic predictions through every registered check model.
+
+        The first forward pass after load is slow: kernels autotune, the
+        allocator grows its pools and (when enabled) torch.compile and
+        CUDA graph capture run. Paying that cost here with dummy inputs
+        spanning short/medium/long sequences keeps it off the first user
+        request. Best-effort: a model that fails to warm up still serves
+        traffic.
+        """
+        try:
+            from nemo_guardrails_cai.models.registry import ModelRegistry
+        except ImportError:
+            return
+
+        # ~4 characters per token, covering the length buckets real
+        # messages land in (short prompt / paragraph / truncated max)
+        warmup_texts = ["warmup " * (tokens // 2) for tokens in (32, 128, 512)]
+
+        for name in ModelRegistry.list_models():
+            model = ModelRegistry.get_model(name)
+            if model is None or not model.is_loaded():
+                continue
+            started = time.monotonic()
+            try:
+                for text in warmup_texts:
+                    model.predict([text])
+                logger.info("Warmed up model '%s' in %.2fs", name, time.monotonic() - started)
+            except Exception as e:
+                logger.warning("Warmup failed for model '%s': %s", name, e)
+
     def start(self) -> None:
         """Start the guardrails server.
 
@@ -121,6 +162,41 @@ class GuardrailsServer:
         # Configure the FastAPI app
         app = api.app
 
+        # Serialize responses with orjson when available; the C encoder
+        # is several times faster than stdlib json on the nested dicts
+        # guardrail predictions and health checks return. FastAPI resolves
+        # the response class when a route is registered, and nemoguardrails
+        # registered its routes at import time, so the existing handlers
+        # are rebuilt as well — changing only the router default would not
+        # affect them.
+        try:
+            # ORJSONResponse imports fine without orjson and only fails at
+            # render time, so probe for the package itself first
+            import fastapi.routing
+            import orjson
+            import starlette.routing
+            from fastapi.datastructures import DefaultPlaceholder
+            from fastapi.responses import ORJSONResponse
+            from fastapi.routing import APIRoute
+
+            # Newer FastAPI wraps route handlers with its own
+            # request_response (exit-stack setup); older versions use
+            # starlette's
+            request_response = getattr(
+                fastapi.routing, "request_response", starlette.routing.request_response
+            )
+
+            app.router.default_response_class = ORJSONResponse
+            for route in app.routes:
+                if isinstance(route, APIRoute) and isinstance(
+                    route.response_class, DefaultPlaceholder
+                ):
+                    route.response_class = ORJSONResponse
+                    route.app = request_response(route.get_route_handler())
+            logger.info("Using orjson %s for JSON responses", orjson.__version__)
+        except ImportError:
+            logger.info("orjson not installed; using default JSON responses")
+
         # Register the rails instance
         api.app.rails = self.rails
 
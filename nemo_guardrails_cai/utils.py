@@ -1,14 +1,133 @@
 """Utility functions for NeMo Guardrails CAI integration."""
 
+import asyncio
 import logging
+import os
+import random
 import time
-from typing import Callable, TypeVar, Any
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+from typing import Callable, Optional, TypeVar
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Weight-file extensions worth prefetching before model load
+_WEIGHT_SUFFIXES = (".safetensors", ".bin")
+_PREFETCH_CHUNK = 16 * 1024 * 1024
+
+
+def _prefetch_one(path: str) -> None:
+    """Read one file sequentially to pull it into the OS page cache."""
+    with open(path, "rb", buffering=0) as f:
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        except (AttributeError, OSError):
+            pass  # Not available on all platforms; plain reads still warm the cache
+        while f.read(_PREFETCH_CHUNK):
+            pass
+
+
+def prefetch_model_files(model_path: str, max_workers: int = 4) -> None:
+    """Warm the page cache for a local model's weight shards in parallel.
+
+    Cold starts are dominated by synchronous, one-shard-at-a-time reads of
+    multi-GB weight files; issuing the reads concurrently keeps an NVMe
+    queue full so the subsequent from_pretrained hits warm pages instead
+    of waiting on disk. Best-effort and a no-op for hub model IDs or
+    paths without weight shards.
+
+    Args:
+        model_path: Local directory containing the model files
+        max_workers: Number of concurrent prefetch readers
+    """
+    if not os.path.isdir(model_path):
+        return
+
+    shards = [
+        entry.path
+        for entry in os.scandir(model_path)
+        if entry.is_file() and entry.name.endswith(_WEIGHT_SUFFIXES)
+    ]
+    if not shards:
+        return
+
+    started = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(shards))) as pool:
+            list(pool.map(_prefetch_one, shards))
+        logger.info(
+            f"Prefetched {len(shards)} weight shard(s) in " f"{time.monotonic() - started:.2f}s"
+        )
+    except OSError as e:
+        logger.warning(f"Weight prefetch failed (continuing without it): {e}")
+
+
+def _rails_config_cache_key(path) -> str:
+    """Fingerprint a config directory by its files' names, mtimes and sizes."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    for file in sorted(p for p in path.rglob("*") if p.is_file()):
+        if ".cache" in file.parts:
+            continue
+        stat = file.stat()
+        digest.update(f"{file.relative_to(path)}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()[:16]
+
+
+def load_rails_config_cached(config_path):
+    """Load a RailsConfig, caching the parsed result next to the config.
+
+    RailsConfig.from_path re-parses every YAML, Colang and prompt file on
+    each server start, which dominates restart time for non-trivial
+    configs. The parsed object is pickled into `<path>/.cache/`, keyed by
+    a fingerprint of all file mtimes and sizes, so unchanged configs load
+    with one unpickle; any edit changes the key and forces a re-parse.
+    Cache reads and writes are best-effort — failures fall back to a
+    normal parse.
+
+    Args:
+        config_path: Path to the guardrails configuration directory
+
+    Returns:
+        Parsed RailsConfig instance
+    """
+    import pickle
+    from pathlib import Path
+
+    from nemoguardrails import RailsConfig
+
+    path = Path(config_path)
+    cache_dir = path / ".cache"
+    cache_file = cache_dir / f"rails_config_{_rails_config_cache_key(path)}.pkl"
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                config = pickle.load(f)
+            logger.info(f"Loaded rails config from cache: {cache_file.name}")
+            return config
+        except Exception as e:
+            logger.warning(f"Stale rails config cache ignored: {e}")
+
+    started = time.monotonic()
+    config = RailsConfig.from_path(str(path))
+    logger.info(f"Parsed rails config in {time.monotonic() - started:.2f}s")
+
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        # Drop caches for previous versions of the config before writing
+        for stale in cache_dir.glob("rails_config_*.pkl"):
+            stale.unlink()
+        with open(cache_file, "wb") as f:
+            pickle.dump(config, f)
+    except Exception as e:
+        logger.warning(f"Could not write rails config cache: {e}")
+
+    return config
+
 
 def retry_with_backoff(
     max_retries: int = 3,
@@ -56,31 +175,98 @@ def retry_with_backoff(
     return decorator
 
 
+def aretry_with_backoff(
+    max_retries: int = 3,
+    initial_delay: float = 1.0,
+    backoff_factor: float = 2.0,
+    max_delay: float = 30.0,
+    total_deadline_s: Optional[float] = None,
+    exceptions: tuple = (Exception,),
+) -> Callable:
+    """Async counterpart of retry_with_backoff for coroutine functions.
+
+    Unlike the sync version, the sleep is non-blocking so the event loop
+    keeps serving other requests between attempts, and the delay is
+    capped and fully jittered (uniform in [0.5x, 1.5x]) so concurrent
+    failures do not retry in lockstep against a recovering backend.
+
+    Args:
+        max_retries: Maximum number of retry attempts
+        initial_delay: Initial delay in seconds
+        backoff_factor: Multiplier for delay after each retry
+        max_delay: Upper bound on the per-attempt delay
+        total_deadline_s: Overall time budget; if the next sleep would
+            exceed it, the last exception is raised immediately
+        exceptions: Tuple of exceptions to catch
+
+    Returns:
+        Decorated coroutine function
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            start = time.monotonic()
+            last_exception = None
+
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    last_exception = e
+                    if attempt >= max_retries:
+                        logger.error(f"All {max_retries} retry attempts failed for {func.__name__}")
+                        break
+
+                    delay = min(initial_delay * backoff_factor**attempt, max_delay)
+                    if (
+                        total_deadline_s is not None
+                        and time.monotonic() - start + delay > total_deadline_s
+                    ):
+                        logger.error(
+                            f"Retry budget of {total_deadline_s}s exhausted for {func.__name__}"
+                        )
+                        break
+
+                    logger.warning(
+                        f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}: {e}. "
+                        f"Retrying in ~{delay}s..."
+                    )
+                    await asyncio.sleep(delay * (0.5 + random.random()))
+
+            raise last_exception
+
+        return wrapper
+
+    return decorator
+
+
 def validate_config_path(config_path: str) -> bool:
     """Validate that a guardrails configuration path exists and has required files.
 
+    One os.scandir pass covers the existence, directory and required-file
+    checks that previously cost a stat syscall each.
+
     Args:
         config_path: Path to guardrails configuration directory
 
     Returns:
         True if valid, False otherwise
     """
-    from pathlib import Path
-
-    path = Path(config_path)
-
-    if not path.exists():
+    try:
+        with os.scandir(config_path) as entries:
+            names = {entry.name for entry in entries}
+    except FileNotFoundError:
         logger.error(f"Config path does not exist: {config_path}")
         return False
-
-    if not path.is_dir():
+    except NotADirectoryError:
         logger.error(f"Config path is not a directory: {config_path}")
         return False
 
     # Check for required files
     required_files = ["config.yml"]
     for file in required_files:
-        if not (path / file).exists():
+        if file not in names:
             logger.warning(f"Required file not found: {file}")
 
     return True
@@ -93,13 +279,14 @@ def setup_logging(log_level: str = "INFO", log_file: str = None) -> None:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional path to log file
     """
+    level = getattr(logging, log_level)
     handlers = [logging.StreamHandler()]
 
     if log_file:
         handlers.append(logging.FileHandler(log_file))
 
     logging.basicConfig(
-        level=getattr(logging, log_level),
+        level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=handlers,
     )